@@ -1,5 +1,14 @@
 import reflex as rx
+from app import routes
+from app.services.catalog import CATALOG
+from app.services.quiz_content import PERSONALITIES
+from app.services.sprites import CSS_URL as SPRITES_CSS_URL
+from app.services.profiles import profile_writer
+from app.services.quiz_stats import quiz_stats_writer
+from app.sessions import session_memory_budget
+from app.states.location_state import LocationState
 from app.states.quiz_state import QuizState
+from app.states.user_state import UserState
 from app.components.header import header
 from app.components.home_page import home_page
 from app.components.quiz_page import quiz_page
@@ -11,23 +20,12 @@ from app.components.achievements_page import achievements_page
 from app.components.visited_locations_page import visited_locations_page
 
 
-def index() -> rx.Component:
+def layout(content: rx.Component, route: str) -> rx.Component:
     return rx.el.main(
         rx.el.div(
-            header(),
+            header(route),
             rx.el.div(
-                rx.match(
-                    QuizState.current_page,
-                    ("home", home_page()),
-                    ("quiz", quiz_page()),
-                    ("results", results_page()),
-                    ("locations", locations_page()),
-                    ("location_detail", location_detail_page()),
-                    ("profile", profile_page()),
-                    ("achievements", achievements_page()),
-                    ("visited_locations", visited_locations_page()),
-                    home_page(),
-                ),
+                content,
                 class_name="w-full max-w-4xl mx-auto p-4 md:p-8",
             ),
             class_name="min-h-screen retro-bg text-white flex flex-col items-center",
@@ -36,6 +34,17 @@ def index() -> rx.Component:
     )
 
 
+# route, page, title, extra on_load handlers (after UserState.load_profile)
+PAGES = (
+    (routes.HOME, home_page, "Poly U Nap", []),
+    (routes.QUIZ, quiz_page, "Sleep Quiz | Poly U Nap", [QuizState.reset_quiz]),
+    (routes.LOCATIONS, locations_page, "Nap Spots | Poly U Nap", []),
+    (routes.PROFILE, profile_page, "Profile | Poly U Nap", []),
+    (routes.ACHIEVEMENTS, achievements_page, "Achievements | Poly U Nap", []),
+    (routes.VISITED_LOCATIONS, visited_locations_page, "Visited Spots | Poly U Nap", []),
+)
+
+
 app = rx.App(
     theme=rx.theme(appearance="light"),
     head_components=[
@@ -46,6 +55,34 @@ app = rx.App(
             rel="stylesheet",
         ),
     ],
-    stylesheets=["/styles.css"],
+    stylesheets=["/styles.css", SPRITES_CSS_URL],
 )
-app.add_page(index, route="/")
\ No newline at end of file
+app.register_lifespan_task(profile_writer)
+app.register_lifespan_task(quiz_stats_writer)
+app.register_lifespan_task(session_memory_budget)
+for route, page, title, on_load in PAGES:
+    app.add_page(
+        layout(page(), route),
+        route=route,
+        title=title,
+        on_load=[UserState.load_profile, *on_load],
+    )
+# One static route per location and per sleeper type, built from the catalog
+# and quiz content so they are prerendered and render before hydration.
+for location in CATALOG.to_list():
+    app.add_page(
+        layout(location_detail_page(location), routes.LOCATIONS),
+        route=routes.location_path(location["id"]),
+        title=f"{location['name']} | Poly U Nap",
+        on_load=[UserState.load_profile, LocationState.load_location(location["id"])],
+    )
+for personality_type, personality in PERSONALITIES.items():
+    if personality_type == "Default":
+        # Placeholder shown before the quiz is finished; never a result page.
+        continue
+    app.add_page(
+        layout(results_page(personality), routes.QUIZ),
+        route=routes.results_path(personality_type),
+        title=f"{personality['title']} | Poly U Nap",
+        on_load=[UserState.load_profile, QuizState.require_results(personality_type)],
+    )
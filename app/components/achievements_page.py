@@ -1,6 +1,6 @@
 import reflex as rx
+from app import routes
 from app.states.user_state import UserState
-from app.states.quiz_state import QuizState
 
 
 def achievement_card(achievement_id: str, achievement_data: dict, unlocked: bool) -> rx.Component:
@@ -60,7 +60,7 @@ def achievements_page() -> rx.Component:
                 rx.el.div(
                     rx.el.button(
                         rx.icon("arrow-left", size=16),
-                        on_click=lambda: QuizState.set_page("home"),
+                        on_click=rx.redirect(routes.HOME),
                         class_name="p-1 border border-[#00ff9f] text-[#00ff9f] hover:bg-[#00ff9f] hover:text-black transition-colors mr-4",
                     ),
                     rx.el.div(
@@ -1,20 +1,23 @@
 import reflex as rx
-from app.states.quiz_state import QuizState
+from app import routes
+from app.states.user_state import UserState
 
 
-def nav_button(text: str, page: str, is_mobile: bool = False) -> rx.Component:
+def nav_button(text: str, route: str, active: str, is_mobile: bool = False) -> rx.Component:
+    navigate = rx.redirect(route)
     return rx.el.button(
         text,
-        on_click=lambda: QuizState.set_page(page),
-        class_name=rx.cond(
-            QuizState.current_page == page,
-            "px-4 py-2 text-sm text-[#00ff9f] text-shadow-neon border-b-4 border-[#00ff9f]",
-            "px-4 py-2 text-sm text-gray-400 hover:text-white transition-colors",
+        on_click=[navigate, UserState.toggle_mobile_menu] if is_mobile else navigate,
+        class_name=(
+            "px-4 py-2 text-sm text-[#00ff9f] text-shadow-neon border-b-4 border-[#00ff9f]"
+            if route == active
+            else "px-4 py-2 text-sm text-gray-400 hover:text-white transition-colors"
         ),
     )
 
 
-def header() -> rx.Component:
+def header(active: str) -> rx.Component:
+    """Site header; ``active`` is the route of the page it is rendered on."""
     return rx.el.header(
         rx.el.div(
             rx.el.div(
@@ -29,16 +32,16 @@ def header() -> rx.Component:
                 class_name="flex items-center",
             ),
             rx.el.nav(
-                nav_button("Home", "home"),
-                nav_button("Quiz", "quiz"),
-                nav_button("Locations", "locations"),
-                nav_button("Profile", "profile"),
+                nav_button("Home", routes.HOME, active),
+                nav_button("Quiz", routes.QUIZ, active),
+                nav_button("Locations", routes.LOCATIONS, active),
+                nav_button("Profile", routes.PROFILE, active),
                 class_name="hidden md:flex items-center gap-4",
             ),
             rx.el.div(
                 rx.el.button(
                     rx.icon(tag="menu", class_name="h-6 w-6"),
-                    on_click=QuizState.toggle_mobile_menu,
+                    on_click=UserState.toggle_mobile_menu,
                     class_name="md:hidden p-2 text-white",
                 ),
                 class_name="md:hidden",
@@ -46,13 +49,13 @@ def header() -> rx.Component:
             class_name="w-full max-w-4xl flex justify-between items-center",
         ),
         rx.cond(
-            QuizState.mobile_menu_open,
+            UserState.mobile_menu_open,
             rx.el.div(
                 rx.el.nav(
-                    nav_button("Home", "home", is_mobile=True),
-                    nav_button("Quiz", "quiz", is_mobile=True),
-                    nav_button("Locations", "locations", is_mobile=True),
-                    nav_button("Profile", "profile", is_mobile=True),
+                    nav_button("Home", routes.HOME, active, is_mobile=True),
+                    nav_button("Quiz", routes.QUIZ, active, is_mobile=True),
+                    nav_button("Locations", routes.LOCATIONS, active, is_mobile=True),
+                    nav_button("Profile", routes.PROFILE, active, is_mobile=True),
                     class_name="flex flex-col items-start gap-4 p-4",
                 ),
                 class_name="md:hidden absolute top-full left-0 w-full bg-[#1a1a2e]/90 backdrop-blur-sm border-b-4 border-[#00ff9f]/20",
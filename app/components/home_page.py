@@ -1,6 +1,5 @@
 import reflex as rx
-from app.states.quiz_state import QuizState
-from app.states.user_state import UserState
+from app import routes
 
 
 def home_page() -> rx.Component:
@@ -26,7 +25,7 @@ def home_page() -> rx.Component:
             ),
             rx.el.button(
                 "▶ PRESS START ◀",
-                on_click=lambda: QuizState.set_page("quiz"),
+                on_click=rx.redirect(routes.QUIZ),
                 class_name="text-[#00ff9f] hover:text-white hover:bg-[#00ff9f]/20 transition-colors duration-300 text-sm md:text-base font-bold py-2 px-4 animate-pulse",
             ),
             class_name="w-full p-8 md:p-12 pixel-border bg-[#1a1a2e]/40 backdrop-blur-sm flex flex-col items-center justify-center mb-6 relative overflow-hidden",
@@ -57,11 +56,11 @@ def home_page() -> rx.Component:
                 ),
                 rx.el.button(
                     "▶ BEGIN",
-                    on_click=lambda: QuizState.set_page("quiz"),
+                    on_click=rx.redirect(routes.QUIZ),
                     class_name="text-[#ff00ff] hover:text-white font-bold text-sm flex items-center gap-2",
                 ),
                 class_name="pixel-border p-6 flex flex-col items-center justify-center bg-[#1a1a2e]/40 backdrop-blur-sm hover:bg-[#00ff9f]/5 transition-colors cursor-pointer",
-                on_click=lambda: QuizState.set_page("quiz"),
+                on_click=rx.redirect(routes.QUIZ),
             ),
             # EXPLORE MAP
             rx.el.div(
@@ -76,11 +75,11 @@ def home_page() -> rx.Component:
                 ),
                 rx.el.button(
                     "▶ EXPLORE",
-                    on_click=lambda: QuizState.set_page("locations"),
+                    on_click=rx.redirect(routes.LOCATIONS),
                     class_name="text-[#00ff9f] hover:text-white font-bold text-sm flex items-center gap-2",
                 ),
                 class_name="pixel-border-cyan p-6 flex flex-col items-center justify-center bg-[#1a1a2e]/40 backdrop-blur-sm hover:bg-[#00d4ff]/5 transition-colors cursor-pointer",
-                on_click=lambda: QuizState.set_page("locations"),
+                on_click=rx.redirect(routes.LOCATIONS),
             ),
             class_name="grid grid-cols-1 md:grid-cols-2 gap-6 w-full mb-6",
         ),
@@ -89,12 +88,12 @@ def home_page() -> rx.Component:
         rx.el.div(
             rx.el.button(
                 rx.el.span("🏆 ACHIEVEMENTS"),
-                on_click=lambda: QuizState.set_page("achievements"), 
+                on_click=rx.redirect(routes.ACHIEVEMENTS), 
                 class_name="pixel-border-yellow text-[#ffd700] bg-[#1a1a2e]/40 backdrop-blur-sm px-6 py-3 text-sm font-bold hover:bg-[#ffd700]/10 transition-colors w-full md:w-auto text-center",
             ),
             rx.el.button(
                 rx.el.span("👤 PROFILE"),
-                on_click=lambda: QuizState.set_page("profile"),
+                on_click=rx.redirect(routes.PROFILE),
                 class_name="pixel-border-magenta text-[#ff00ff] bg-[#1a1a2e]/40 backdrop-blur-sm px-6 py-3 text-sm font-bold hover:bg-[#ff00ff]/10 transition-colors w-full md:w-auto text-center",
             ),
             class_name="flex flex-col md:flex-row gap-4 justify-center w-full mb-8",
@@ -1,12 +1,16 @@
 import reflex as rx
-from app.states.location_state import LocationState as LS
+from app import routes
+from app.components.sprite_icon import sprite_icon
+from app.components.tile_map import tile_map
+
+# The map spans the page's max-w-4xl (56rem) content column.
+MAP_SIZES = "(max-width: 896px) 100vw, 896px"
 
 
 class MapState(rx.State):
     """State for interactive map navigation"""
     selected_building: str = ""  # "library" or "jcit" or ""
     current_floor: str = "G"  # Current floor level
-    hovered_icon: str = ""  # Currently hovered location icon
     show_floor_detail: bool = False  # Show detailed floor map
     
     # Building to floor mapping
@@ -56,25 +60,12 @@ class MapState(rx.State):
         except ValueError:
             pass
     
-    @rx.event
-    async def select_location_and_close(self, location_id: str):
-        """Select a location and close the floor view"""
-        location_state = await self.get_state(LS)
-        await location_state.select_location(location_id)
-        self.show_floor_detail = False
-        self.selected_building = ""
-    
     @rx.event
     def close_floor_view(self):
         """Close the detailed floor view"""
         self.show_floor_detail = False
         self.selected_building = ""
     
-    @rx.event
-    def set_hovered_icon(self, location_id: str):
-        """Set the hovered location icon"""
-        self.hovered_icon = location_id
-    
     @rx.var
     def current_floor_locations(self) -> list[dict]:
         """Get locations for the current floor"""
@@ -233,11 +224,9 @@ def floor_location_icon(location: rx.Var[dict]) -> rx.Component:
     
     return rx.el.div(
         # Icon
-        rx.icon(
-            tag="locate-fixed",
-            size=32,
-            color="#00ff9f",
-            class_name="cursor-pointer transition-all duration-300",
+        sprite_icon(
+            location.icon_type,
+            class_name="w-8 cursor-pointer transition-all duration-300",
             style={
                 "filter": "drop-shadow(0 0 4px #00ff9f)",
                 "_hover": {
@@ -246,34 +235,27 @@ def floor_location_icon(location: rx.Var[dict]) -> rx.Component:
             }
         ),
         # Popup on hover
-        rx.cond(
-            MapState.hovered_icon == location.id,
+        rx.el.div(
             rx.el.div(
-                rx.el.div(
-                    rx.text(
-                        location.name,
-                        class_name="text-xs font-bold text-white mb-1"
-                    ),
-                    rx.text(
-                        location.location,
-                        class_name="text-[10px] text-gray-300"
-                    ),
-                    class_name="bg-[#1a1a2e]/90 backdrop-blur-sm border-4 border-[#00ff9f] p-2 rounded shadow-lg"
+                rx.text(
+                    location.name,
+                    class_name="text-xs font-bold text-white mb-1"
                 ),
-                class_name="absolute bottom-full left-1/2 transform -translate-x-1/2 mb-2 whitespace-nowrap z-50"
+                rx.text(
+                    location.location,
+                    class_name="text-[10px] text-gray-300"
+                ),
+                class_name="bg-[#1a1a2e]/90 backdrop-blur-sm border-4 border-[#00ff9f] p-2 rounded shadow-lg"
             ),
-            rx.el.div()
+            class_name="absolute bottom-full left-1/2 transform -translate-x-1/2 mb-2 whitespace-nowrap z-50 hidden group-hover:block"
         ),
-        on_mouse_enter=MapState.set_hovered_icon(location.id),
-        on_mouse_leave=MapState.set_hovered_icon(""),
-        on_click=MapState.select_location_and_close(location.id),
-        class_name="absolute cursor-pointer",
+        on_click=[MapState.close_floor_view, rx.redirect(routes.location_path(location.id))],
+        class_name="group absolute cursor-pointer z-40 hover:z-[100]",
         # Position based on location data
         style={
             "top": location.y,
             "left": location.x,
             "transform": "translate(-50%, -100%)",  # Center the icon horizontally and position bottom at coordinate
-            "zIndex": rx.cond(MapState.hovered_icon == location.id, "100", "40"),
         }
     )
 
@@ -284,11 +266,9 @@ def outdoor_location_icon(location_id: str, location_name: str, x: str, y: str,
     return rx.el.div(
         # Clickable icon
         rx.el.div(
-            rx.icon(
-                tag="locate-fixed",
-                size=32,
-                color="#00ff9f",
-                class_name="cursor-pointer transition-all duration-300",
+            sprite_icon(
+                icon_type,
+                class_name="w-8 cursor-pointer transition-all duration-300",
                 style={
                     "filter": "drop-shadow(0 0 4px #00ff9f)",
                     "_hover": {
@@ -296,39 +276,30 @@ def outdoor_location_icon(location_id: str, location_name: str, x: str, y: str,
                     }
                 }
             ),
-            on_click=LS.select_location(location_id),
+            on_click=rx.redirect(routes.location_path(location_id)),
             class_name="relative z-30"
         ),
         
         # Hover popup showing location name
-        rx.cond(
-            MapState.hovered_icon == location_id,
+        rx.el.div(
             rx.el.div(
-                rx.el.div(
-                    rx.text(
-                        location_name,
-                        class_name="text-sm font-bold text-[#00ff9f] mb-1"
-                    ),
-                    rx.text(
-                        "Click to view details",
-                        class_name="text-xs text-gray-300"
-                    ),
-                    class_name="bg-[#1a1a2e]/90 backdrop-blur-sm pixel-border p-3 rounded shadow-xl"
+                rx.text(
+                    location_name,
+                    class_name="text-sm font-bold text-[#00ff9f] mb-1"
                 ),
-                class_name="absolute bottom-full left-1/2 transform -translate-x-1/2 mb-2 whitespace-nowrap z-50"
+                rx.text(
+                    "Click to view details",
+                    class_name="text-xs text-gray-300"
+                ),
+                class_name="bg-[#1a1a2e]/90 backdrop-blur-sm pixel-border p-3 rounded shadow-xl"
             ),
-            rx.el.div()
+            class_name="absolute bottom-full left-1/2 transform -translate-x-1/2 mb-2 whitespace-nowrap z-50 hidden group-hover:block"
         ),
-        
-        on_mouse_enter=MapState.set_hovered_icon(location_id),
-        on_mouse_leave=MapState.set_hovered_icon(""),
-        
-        class_name="absolute cursor-pointer",
+        class_name="group absolute cursor-pointer z-30 hover:z-[100]",
         style={
             "top": y,
             "left": x,
             "transform": "translate(-50%, -100%)",
-            "zIndex": rx.cond(MapState.hovered_icon == location_id, "100", "30"),
         }
     )
 
@@ -356,33 +327,24 @@ def building_icon_on_main_map(building: str, x: str, y: str) -> rx.Component:
         ),
         
         # Hover popup showing building name
-        rx.cond(
-            MapState.hovered_icon == building,
+        rx.el.div(
             rx.el.div(
-                rx.el.div(
-                    rx.text(
-                        "Pao Yue-kong Library" if building == "library" else "Jockey Club Innovation Tower",
-                        class_name="text-sm font-bold text-[#00ff9f] mb-1"
-                    ),
-                    rx.text(
-                        "Click to explore",
-                        class_name="text-xs text-gray-300"
-                    ),
-                    class_name="bg-[#1a1a2e]/90 backdrop-blur-sm pixel-border p-3 rounded shadow-xl"
+                rx.text(
+                    "Pao Yue-kong Library" if building == "library" else "Jockey Club Innovation Tower",
+                    class_name="text-sm font-bold text-[#00ff9f] mb-1"
+                ),
+                rx.text(
+                    "Click to explore",
+                    class_name="text-xs text-gray-300"
                 ),
-                class_name="absolute bottom-full left-1/2 transform -translate-x-1/2 mb-2 whitespace-nowrap z-50"
+                class_name="bg-[#1a1a2e]/90 backdrop-blur-sm pixel-border p-3 rounded shadow-xl"
             ),
-            rx.el.div()
+            class_name="absolute bottom-full left-1/2 transform -translate-x-1/2 mb-2 whitespace-nowrap z-50 hidden group-hover:block"
         ),
-        
-        on_mouse_enter=MapState.set_hovered_icon(building),
-        on_mouse_leave=MapState.set_hovered_icon(""),
-        
-        class_name="absolute cursor-pointer",
+        class_name="group absolute cursor-pointer z-30 hover:z-[100]",
         style={
             "top": y,
             "left": x,
-            "zIndex": rx.cond(MapState.hovered_icon == building, "100", "30"),
         }
     )
 
@@ -421,12 +383,9 @@ def interactive_campus_map() -> rx.Component:
             
             # Main map display area
             rx.el.div(
-                # Map image (campus or floor)
-                rx.el.div(
-                    rx.image(
-                        src=MapState.current_map_image,
-                        class_name="w-full h-auto"
-                    ),
+                # Zoomable map (campus or floor) with its icons
+                tile_map(
+                    MapState.current_map_image,
                     
                     # Campus map icons (only show when no building selected)
                     rx.cond(
@@ -454,6 +413,7 @@ def interactive_campus_map() -> rx.Component:
                         rx.fragment()
                     ),
                     
+                    sizes=MAP_SIZES,
                     class_name="relative w-full"
                 ),
                 
@@ -465,7 +425,7 @@ def interactive_campus_map() -> rx.Component:
                         rx.cond(
                             MapState.can_go_up,
                             rx.el.button(
-                                rx.icon(tag="chevron-up", size=32, color="#00ff9f"),
+                                sprite_icon("icon-up", class_name="w-8"),
                                 on_click=MapState.change_floor("up"),
                                 class_name="p-3 hover:bg-gray-800 rounded transition-colors"
                             ),
@@ -475,7 +435,7 @@ def interactive_campus_map() -> rx.Component:
                         rx.cond(
                             MapState.can_go_down,
                             rx.el.button(
-                                rx.icon(tag="chevron-down", size=32, color="#00ff9f"),
+                                sprite_icon("icon-down", class_name="w-8"),
                                 on_click=MapState.change_floor("down"),
                                 class_name="p-3 hover:bg-gray-800 rounded transition-colors"
                             ),
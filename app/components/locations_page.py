@@ -1,7 +1,7 @@
 import reflex as rx
-from app.states.location_state import LocationState, Location
+from app import routes
+from app.states.location_state import LocationState, Location, LOCATIONS
 from app.states.quiz_state import QuizState
-from app.components.sketchfab import sketchfab_model
 from app.components.interactive_map import interactive_campus_map
 
 
@@ -42,7 +42,7 @@ def location_card(location: Location) -> rx.Component:
     avg_ratings = LocationState.average_ratings.get(location["id"], {})
     overall_rating = avg_ratings.get("overall", 0.0)
     is_checked_in = LocationState.checked_in_locations.contains(location["id"])
-    is_recommended = QuizState.personality_details["spots"].contains(location["id"])
+    is_recommended = QuizState.recommended_spots.contains(location["id"])
     
     rarity_color = rx.match(
         location["rarity"],
@@ -132,7 +132,7 @@ def location_card(location: Location) -> rx.Component:
             ),
             rx.el.button(
                 "VIEW DETAILS",
-                on_click=lambda: LocationState.select_location(location["id"]),
+                on_click=rx.redirect(routes.location_path(location["id"])),
                 class_name="w-full pixel-border text-[#00ff9f] text-xs py-2 hover:bg-[#00ff9f] hover:text-black transition-colors font-bold tracking-wider"
             ),
             class_name="mt-auto w-full"
@@ -192,7 +192,7 @@ def locations_page() -> rx.Component:
 
             # Locations Grid
             rx.el.div(
-                rx.foreach(LocationState.locations, location_card),
+                rx.foreach(LOCATIONS, location_card),
                 class_name="grid grid-cols-1 md:grid-cols-2 gap-4 md:gap-6 w-full",
             ),
             
@@ -204,5 +204,6 @@ def locations_page() -> rx.Component:
 
             class_name="max-w-6xl mx-auto w-full flex flex-col"
         ),
+        on_mount=[LocationState.refresh_community_ratings, QuizState.refresh_recommendations],
         class_name="min-h-screen retro-bg p-4 md:p-8 font-mono"
     )
@@ -0,0 +1,35 @@
+import reflex as rx
+from app.components.responsive_image import responsive_image
+from app.services.map_overlays import OVERLAYS
+
+
+def _composite(entry: dict, sizes: str, class_name: str) -> rx.Component:
+    layer = entry["overlay"]
+    return rx.el.div(
+        responsive_image(entry["base"], sizes=sizes, class_name=class_name),
+        rx.el.img(
+            src=layer["src"],
+            alt="",
+            decoding="async",
+            class_name="absolute pointer-events-none",
+            style={key: layer[key] for key in ("left", "top", "width", "height")},
+        ) if layer else rx.fragment(),
+        class_name="relative",
+    )
+
+
+def map_variant(src: str | rx.Var[str], sizes: str, class_name: str = "") -> rx.Component:
+    """A map image, drawn as base map plus overlay when ``src`` is a highlight variant.
+
+    The browser caches the one base map and fetches a few KB per variant
+    instead of a full copy of the map. Other images render as usual.
+    """
+    if not isinstance(src, rx.Var):
+        if src in OVERLAYS:
+            return _composite(OVERLAYS[src], sizes, class_name)
+        return responsive_image(src, sizes=sizes, class_name=class_name)
+    return rx.match(
+        src,
+        *((variant, _composite(entry, sizes, class_name)) for variant, entry in OVERLAYS.items()),
+        responsive_image(src, sizes=sizes, class_name=class_name),
+    )
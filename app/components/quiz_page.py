@@ -1,24 +1,32 @@
 import reflex as rx
-from app.states.quiz_state import QuizState
+from reflex.experimental.client_state import ClientStateVar
+from app.states.quiz_state import QuizState, QUIZ_QUESTIONS
 
+# Answers live in the browser until the last one, then go up in one event.
+quiz_answers = ClientStateVar.create("quiz_answers", default=[])
+answers = quiz_answers.value.to(list[str])
+question_index = answers.length()
+is_last_question = question_index == QUIZ_QUESTIONS.length() - 1
 
-def choice_button(
-    question_index: int, choice_key: str, choice_data: dict
-) -> rx.Component:
-    return rx.el.button(
-        rx.el.div(
-            rx.el.span(choice_data["emoji"], class_name="text-xl mr-3"),
-            rx.el.h3(
-                choice_data["title"], class_name="text-sm md:text-base text-gray-200 font-mono text-left"
-            ),
-            class_name="flex items-center",
+
+def choice_button(choice_key: rx.Var[str], choice_data: dict) -> rx.Component:
+    with_choice = answers + rx.Var.create([choice_key])
+    content = rx.el.div(
+        rx.el.span(choice_data["emoji"], class_name="text-xl mr-3"),
+        rx.el.h3(
+            choice_data["title"], class_name="text-sm md:text-base text-gray-200 font-mono text-left"
         ),
-        on_click=lambda: QuizState.handle_answer(question_index, choice_key),
-        class_name="w-full p-4 bg-[#1a1a2e]/80 border-4 border-gray-700 hover:border-[#00ff9f] hover:bg-[#00ff9f]/10 transition-all duration-200 flex justify-start items-center mb-3 group",
+        class_name="flex items-center",
+    )
+    class_name = "w-full p-4 bg-[#1a1a2e]/80 border-4 border-gray-700 hover:border-[#00ff9f] hover:bg-[#00ff9f]/10 transition-all duration-200 flex justify-start items-center mb-3 group"
+    return rx.cond(
+        is_last_question,
+        rx.el.button(content, on_click=QuizState.submit_quiz(with_choice), class_name=class_name),
+        rx.el.button(content, on_click=quiz_answers.set_value(with_choice), class_name=class_name),
     )
 
 
-def quiz_question(question: dict, index: int) -> rx.Component:
+def quiz_question(question: dict) -> rx.Component:
     choices = question["choices"].entries()
     return rx.el.div(
         # Question Header
@@ -31,24 +39,20 @@ def quiz_question(question: dict, index: int) -> rx.Component:
         rx.el.div(
             rx.foreach(
                 choices,
-                lambda choice: choice_button(index, choice[0], choice[1]),
+                lambda choice: choice_button(choice[0], choice[1]),
             ),
             class_name="flex flex-col w-full max-w-2xl mx-auto",
         ),
         
-        # Navigation Buttons
+        # Back Button (picking a choice moves on)
         rx.el.div(
             rx.el.button(
                 "← BACK",
-                # Logic for back button could be added to QuizState if needed, for now it's visual or could reset
+                on_click=quiz_answers.set_value(answers[:-1]),
+                disabled=question_index == 0,
                 class_name="px-6 py-2 border-4 border-[#ff00ff] text-[#ff00ff] font-bold text-xs hover:bg-[#ff00ff] hover:text-black transition-colors font-mono"
             ),
-            rx.el.button(
-                "NEXT →",
-                # Next is handled by clicking an option in the current design, but we can keep this for visual consistency or future manual navigation
-                class_name="px-6 py-2 bg-[#00ff9f] text-black font-bold text-xs hover:bg-[#00ff9f]/80 transition-colors font-mono"
-            ),
-            class_name="flex justify-between w-full max-w-2xl mx-auto mt-8"
+            class_name="flex justify-start w-full max-w-2xl mx-auto mt-8"
         ),
         
         # Tip Footer
@@ -64,7 +68,7 @@ def quiz_question(question: dict, index: int) -> rx.Component:
 def progress_bar() -> rx.Component:
     return rx.el.div(
         rx.el.div(
-            style={"width": QuizState.progress_percent},
+            style={"width": (question_index / QUIZ_QUESTIONS.length() * 100).to_string() + "%"},
             class_name="h-full bg-gradient-to-r from-[#00ff9f] to-[#bd00ff] border-r-4 border-black transition-all duration-500",
         ),
         class_name="w-full h-6 bg-black/40 border-2 border-gray-700 relative overflow-hidden mb-6",
@@ -88,18 +92,18 @@ def quiz_page() -> rx.Component:
                     rx.el.h1("CHARACTER CREATION", class_name="text-xl font-bold text-[#00ff9f] tracking-widest text-shadow-neon text-center mb-2"),
                     rx.el.div(
                         rx.text("STAGE ", class_name="text-xs text-[#bd00ff] font-mono"),
-                        rx.text(QuizState.current_question_index + 1, class_name="text-xs text-[#bd00ff] font-mono"),
+                        rx.text(question_index + 1, class_name="text-xs text-[#bd00ff] font-mono"),
                         rx.text(" / ", class_name="text-xs text-gray-500 font-mono"),
-                        rx.text(QuizState.questions.length(), class_name="text-xs text-gray-500 font-mono"),
+                        rx.text(QUIZ_QUESTIONS.length(), class_name="text-xs text-gray-500 font-mono"),
                         class_name="flex justify-center gap-1 mb-2"
                     ),
                     # Progress Squares (Visual only for now, could be dynamic)
                     rx.el.div(
                         rx.foreach(
-                            QuizState.questions,
+                            QUIZ_QUESTIONS,
                             lambda _, i: rx.el.div(
                                 class_name=rx.cond(
-                                    i <= QuizState.current_question_index,
+                                    i <= question_index,
                                     "w-3 h-3 bg-[#00ff9f] mx-1 border border-black",
                                     "w-3 h-3 bg-[#1a1a2e] border border-gray-700 mx-1"
                                 )
@@ -113,13 +117,12 @@ def quiz_page() -> rx.Component:
                 progress_bar(),
                 
                 rx.el.div(
-                    quiz_question(
-                        QuizState.current_question, QuizState.current_question_index
-                    ),
+                    quiz_question(QUIZ_QUESTIONS[question_index]),
                     class_name="w-full max-w-3xl mx-auto p-6 pixel-border-purple min-h-[400px] flex flex-col justify-center",
                 ),
                 class_name="w-full max-w-3xl mx-auto",
             ),
         ),
+        on_mount=quiz_answers.set_value([]),
         class_name="min-h-screen retro-bg p-4 md:p-8 font-mono flex flex-col items-center justify-center",
     )
\ No newline at end of file
@@ -0,0 +1,32 @@
+import reflex as rx
+from app.services.responsive_images import FORMAT_TYPES, SRCSETS
+
+# Compile-time lookup tables, so a state-driven src can pick its srcset in
+# the browser. A src missing from the manifest yields no srcset.
+_SRCSET_VARS: dict[str, rx.Var[dict[str, str]]] = {
+    ext: rx.Var.create(table).to(dict[str, str]) for ext, table in SRCSETS.items()
+}
+
+
+def responsive_image(src: str | rx.Var[str], sizes: str, **props) -> rx.Component:
+    """A ``<picture>`` offering the AVIF/WebP widths of ``src``.
+
+    ``sizes`` is the CSS width the image is displayed at, e.g.
+    ``"(max-width: 896px) 100vw, 896px"``; the browser uses it to pick the
+    smallest file that is sharp enough. The original PNG stays the fallback.
+    """
+    sources = []
+    for ext, mime in FORMAT_TYPES.items():
+        if isinstance(src, rx.Var):
+            src_set = _SRCSET_VARS[ext][src]
+        elif src in SRCSETS[ext]:
+            src_set = SRCSETS[ext][src]
+        else:
+            continue
+        sources.append(rx.el.source(type=mime, src_set=src_set, sizes=sizes))
+    return rx.el.picture(
+        *sources,
+        rx.el.img(src=src, decoding="async", **props),
+        # Lay the <img> out as if it were the wrapper's direct child.
+        class_name="contents",
+    )
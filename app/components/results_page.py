@@ -1,7 +1,7 @@
 import reflex as rx
+from app import routes
+from app.services.quiz_content import Personality
 from app.states.quiz_state import QuizState
-from app.states.user_state import UserState
-from app.states.location_state import LocationState
 
 
 def unlocked_location_tag(spot_id: str) -> rx.Component:
@@ -24,12 +24,17 @@ def unlocked_location_tag(spot_id: str) -> rx.Component:
     return rx.el.div(
         rx.icon("map-pin", size=12, class_name="mr-1"),
         rx.text(location_name, class_name="text-[10px] font-bold"),
-        on_click=LocationState.select_location(spot_id),
+        on_click=rx.redirect(routes.location_path(spot_id)),
         class_name="flex items-center px-2 py-1 border-2 border-[#bd00ff] text-[#bd00ff] mr-2 mb-2 cursor-pointer hover:bg-[#bd00ff] hover:text-black transition-colors"
     )
 
 
-def results_page() -> rx.Component:
+def results_page(personality: Personality) -> rx.Component:
+    """Result page of one sleeper type.
+
+    The persona text is baked in as literals so the route is prerendered;
+    the recommended spots fill in once state hydrates.
+    """
     return rx.el.div(
         rx.el.div(
             # Header Box
@@ -40,12 +45,12 @@ def results_page() -> rx.Component:
                 
                 rx.el.div(
                     rx.icon(
-                        QuizState.personality_details["icon"],
+                        personality["icon"],
                         class_name="h-16 w-16 text-[#ff0055] mb-4 animate-bounce-slow",
                     ),
                     rx.text("[ CHARACTER ANALYSIS COMPLETE ]", class_name="text-xs text-gray-400 font-mono mb-2 tracking-widest"),
                     rx.el.h2(
-                        QuizState.personality_details["title"],
+                        personality["title"],
                         class_name="text-3xl md:text-4xl text-[#00ff9f] font-bold text-shadow-neon mb-4 text-center tracking-wider uppercase",
                     ),
                     rx.el.div(
@@ -65,11 +70,11 @@ def results_page() -> rx.Component:
                     rx.icon("zap", size=16, class_name="text-[#ffd700] mr-2 mt-1"),
                     rx.el.div(
                         rx.text(
-                            f"Class: {QuizState.personality_details['title']} | Stats: REQUIREMENTS +MAX, SATISFACTION +100 WHEN MET",
+                            f"Class: {personality['title']} | Stats: REQUIREMENTS +MAX, SATISFACTION +100 WHEN MET",
                             class_name="text-xs text-gray-300 font-mono mb-2"
                         ),
                         rx.text(
-                            f"Special Ability: \"Perfect Setup\" - {QuizState.personality_details['description']}",
+                            f"Special Ability: \"Perfect Setup\" - {personality['description']}",
                             class_name="text-xs text-gray-400 font-mono mb-2 leading-relaxed"
                         ),
                         rx.text(
@@ -85,7 +90,7 @@ def results_page() -> rx.Component:
                     rx.text(">> BEST MATCH / RECOMMENDED LOCATIONS:", class_name="text-xs text-[#00ff9f] font-bold mb-3 tracking-wider"),
                     rx.el.div(
                         rx.foreach(
-                            QuizState.personality_details["spots"],
+                            QuizState.recommended_spots,
                             unlocked_location_tag
                         ),
                         class_name="flex flex-wrap"
@@ -101,19 +106,19 @@ def results_page() -> rx.Component:
                 rx.el.button(
                     rx.icon("map-pin", size=14, class_name="mr-2 text-black"),
                     "START QUEST",
-                    on_click=lambda: QuizState.set_page("locations"),
+                    on_click=rx.redirect(routes.LOCATIONS),
                     class_name="flex-1 bg-[#00ff9f] text-black font-bold text-sm py-3 border-2 border-[#00ff9f] hover:bg-black hover:text-[#00ff9f] transition-colors flex items-center justify-center mr-4"
                 ),
                 rx.el.button(
                     rx.icon("rotate-ccw", size=14, class_name="mr-2"),
                     "RETRY",
-                    on_click=QuizState.reset_quiz,
+                    on_click=rx.redirect(routes.QUIZ),
                     class_name="px-6 border-2 border-[#bd00ff] text-[#bd00ff] font-bold text-sm py-3 hover:bg-[#bd00ff] hover:text-black transition-colors flex items-center justify-center mr-4"
                 ),
                 rx.el.button(
                     rx.icon("home", size=14, class_name="mr-2"),
                     "HOME",
-                    on_click=lambda: QuizState.set_page("home"),
+                    on_click=rx.redirect(routes.HOME),
                     class_name="px-6 border-2 border-[#bd00ff] text-[#bd00ff] font-bold text-sm py-3 hover:bg-[#bd00ff] hover:text-black transition-colors flex items-center justify-center"
                 ),
                 class_name="flex w-full max-w-3xl mx-auto mb-8"
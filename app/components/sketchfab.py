@@ -1,64 +1,69 @@
 import reflex as rx
 from typing import Optional
+from reflex.experimental.client_state import ClientStateVar
+
+from app.services.sketchfab_posters import poster_url
+
+FRAME_STYLE = "width:100%; position:relative; padding-bottom:56.25%; height:0; overflow:hidden;"
+
+
+def _viewer(model_id: str, title: str) -> rx.Component:
+    return rx.html(
+        f"""
+        <div style="{FRAME_STYLE}">
+          <iframe
+            title="{title}"
+            src="https://sketchfab.com/models/{model_id}/embed?autostart=1&transparent=1&ui_theme=dark&ui_infos=0&ui_controls=0&ui_stop=0"
+            frameborder="0"
+            allow="autoplay; fullscreen; xr-spatial-tracking"
+            allowfullscreen
+            style="position:absolute; top:0; left:0; width:100%; height:100%; background: transparent;">
+          </iframe>
+        </div>
+        """
+    )
+
+
+def _poster(model_id: str, title: str, on_click) -> rx.Component:
+    src = poster_url(model_id)
+    if src is None:
+        backdrop = rx.el.div(class_name="absolute inset-0 bg-gradient-to-br from-[#1a1a2e] to-[#2d1b4e]")
+    else:
+        backdrop = rx.el.img(
+            src=src,
+            alt=title,
+            decoding="async",
+            class_name="absolute inset-0 w-full h-full object-cover",
+        )
+    return rx.el.button(
+        backdrop,
+        rx.el.div(
+            rx.icon("play", class_name="h-10 w-10 text-[#00d4ff]"),
+            rx.el.span("TAP TO LOAD 3D SCAN", class_name="text-xs font-bold tracking-widest text-white"),
+            class_name="absolute inset-0 flex flex-col items-center justify-center gap-2 bg-black/40 hover:bg-black/20 transition-colors",
+        ),
+        type="button",
+        aria_label=f"Load 3D scan of {title}",
+        on_click=on_click,
+        class_name="relative block w-full pb-[56.25%] overflow-hidden cursor-pointer",
+    )
+
 
 def sketchfab_model(model_id: str, height: str = "360px", title: Optional[str] = None):
     """
-    Returns an rx.html containing a Sketchfab iframe.
+    Returns a Sketchfab viewer that loads on tap.
     - model_id: the Sketchfab model id (the part in the URL after /models/)
     - height: CSS height (e.g. "360px" or "50vh")
+
+    Until the visitor taps it, only the model's local poster (see
+    ``build_sketchfab_posters.py``) is shown, so the third-party viewer is not
+    fetched on page load. The toggle lives in the browser; no event reaches
+    the server.
     """
-    # Handle the title properly for reactive variables
-    if isinstance(title, rx.Var):
-        # If title is a Var, we need to handle it differently
-        # We'll use a conditional approach in the component
-        return rx.cond(
-            title,
-            rx.html(
-                f"""
-                <div style="width:100%; position:relative; padding-bottom:56.25%; height:0; overflow:hidden;">
-                  <iframe
-                    title="{{title.to(str)}}"
-                    src="https://sketchfab.com/models/{model_id}/embed?autostart=1&transparent=1&ui_theme=dark&ui_infos=0&ui_controls=0&ui_stop=0"
-                    frameborder="0"
-                    allow="autoplay; fullscreen; xr-spatial-tracking"
-                    allowfullscreen
-                    loading="lazy"
-                    style="position:absolute; top:0; left:0; width:100%; height:100%; background: transparent;">
-                  </iframe>
-                </div>
-                """
-            ),
-            rx.html(
-                f"""
-                <div style="width:100%; position:relative; padding-bottom:56.25%; height:0; overflow:hidden;">
-                  <iframe
-                    title="Sketchfab Model"
-                    src="https://sketchfab.com/models/{model_id}/embed"
-                    frameborder="0"
-                    allow="autoplay; fullscreen; xr-spatial-tracking"
-                    allowfullscreen
-                    loading="lazy"
-                    style="position:absolute; top:0; left:0; width:100%; height:100%;">
-                  </iframe>
-                </div>
-                """
-            )
-        )
-    else:
-        # For static titles
-        title_attr = title or f"Sketchfab {model_id}"
-        return rx.html(
-            f"""
-            <div style="width:100%; position:relative; padding-bottom:56.25%; height:0; overflow:hidden;">
-              <iframe
-                title="{title_attr}"
-                src="https://sketchfab.com/models/{model_id}/embed?autostart=1&transparent=1&ui_theme=dark&ui_infos=0&ui_controls=0&ui_stop=0"
-                frameborder="0"
-                allow="autoplay; fullscreen; xr-spatial-tracking"
-                allowfullscreen
-                loading="lazy"
-                style="position:absolute; top:0; left:0; width:100%; height:100%; background: transparent;">
-              </iframe>
-            </div>
-            """
-        )
\ No newline at end of file
+    title = title or f"Sketchfab {model_id}"
+    loaded = ClientStateVar.create(f"sketchfab_{model_id}", default=False)
+    return rx.cond(
+        loaded.value,
+        _viewer(model_id, title),
+        _poster(model_id, title, loaded.set_value(True)),
+    )
@@ -0,0 +1,9 @@
+import reflex as rx
+
+
+def sprite_icon(name: str | rx.Var[str], class_name: str = "", **props) -> rx.Component:
+    """An icon from the ``build_icon_sprites.py`` atlas, e.g. ``"far"`` or ``"icon-up"``.
+
+    Size it with a width class such as ``w-8``; the height follows the icon.
+    """
+    return rx.el.div(class_name=f"map-icon map-icon-{name} {class_name}", role="img", **props)
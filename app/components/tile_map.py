@@ -0,0 +1,31 @@
+import reflex as rx
+from app.components.responsive_image import responsive_image
+from app.services.map_tiles import PYRAMIDS
+
+# Compile-time lookup so a state-driven src finds its pyramid in the browser.
+_PYRAMIDS_VAR: rx.Var[dict[str, dict]] = rx.Var.create(PYRAMIDS).to(dict[str, dict])
+
+
+class TileMap(rx.Component):
+    """Pan/zoom map loading only the visible tiles (``assets/tile_map.jsx``)."""
+
+    library = "$/public/tile_map.jsx"
+    tag = "TileMap"
+
+    # A map_tiles manifest entry; falsy renders the children in a plain box.
+    pyramid: rx.Var[dict]
+
+
+def tile_map(src: str | rx.Var[str], *overlays: rx.Component, sizes: str, **props) -> rx.Component:
+    """The map at ``src`` with ``overlays`` positioned in percent on top of it.
+
+    Maps cut by ``build_map_tiles.py`` become a zoomable ``TileMap``; others
+    fall back to a ``responsive_image`` with the same overlays.
+    """
+    fallback = responsive_image(src, sizes=sizes, class_name="w-full h-auto")
+    if not isinstance(src, rx.Var):
+        if src not in PYRAMIDS:
+            return rx.el.div(fallback, *overlays, **props)
+        return TileMap.create(*overlays, pyramid=PYRAMIDS[src], **props)
+    pyramid = _PYRAMIDS_VAR[src]
+    return TileMap.create(rx.cond(pyramid, rx.fragment(), fallback), *overlays, pyramid=pyramid, **props)
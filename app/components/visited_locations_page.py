@@ -1,6 +1,6 @@
 import reflex as rx
-from app.states.location_state import LocationState, Location
-from app.states.quiz_state import QuizState
+from app import routes
+from app.states.location_state import LocationState, Location, LOCATIONS
 
 
 def visited_location_card(location: Location) -> rx.Component:
@@ -69,7 +69,7 @@ def visited_location_card(location: Location) -> rx.Component:
             ),
             rx.el.button(
                 "VIEW DETAILS",
-                on_click=lambda: LocationState.select_location(location["id"]),
+                on_click=rx.redirect(routes.location_path(location["id"])),
                 class_name="w-full border-4 border-[#00ff9f] text-[#00ff9f] text-xs py-2 hover:bg-[#00ff9f] hover:text-black transition-colors font-bold tracking-wider"
             ),
             class_name="mt-auto w-full"
@@ -87,7 +87,7 @@ def visited_locations_page() -> rx.Component:
                 rx.el.div(
                     rx.el.button(
                         rx.icon("arrow-left", size=16),
-                        on_click=lambda: QuizState.set_page("profile"),
+                        on_click=rx.redirect(routes.PROFILE),
                         class_name="p-1 border-4 border-[#bd00ff] text-[#bd00ff] hover:bg-[#bd00ff] hover:text-black transition-colors mr-4",
                     ),
                     rx.el.div(
@@ -109,7 +109,7 @@ def visited_locations_page() -> rx.Component:
                     class_name="flex flex-col items-center justify-center p-4 border border-[#bd00ff] bg-[#1a1a2e]/40 backdrop-blur-sm"
                 ),
                 rx.el.div(
-                    rx.text(f"{LocationState.explored_count}/{LocationState.locations.length()}", class_name="text-2xl font-bold text-[#00ff9f] mb-1"),
+                    rx.text(f"{LocationState.explored_count}/{LOCATIONS.length()}", class_name="text-2xl font-bold text-[#00ff9f] mb-1"),
                     rx.text("PROGRESS", class_name="text-[10px] text-gray-400 uppercase tracking-wider"),
                     class_name="flex flex-col items-center justify-center p-4 border border-[#00ff9f] bg-[#1a1a2e]/40 backdrop-blur-sm"
                 ),
@@ -122,7 +122,7 @@ def visited_locations_page() -> rx.Component:
                 # Locations Grid
                 rx.el.div(
                     rx.foreach(
-                        LocationState.locations,
+                        LOCATIONS,
                         lambda loc: rx.cond(
                             LocationState.checked_in_locations.contains(loc["id"]),
                             visited_location_card(loc),
@@ -139,7 +139,7 @@ def visited_locations_page() -> rx.Component:
                     rx.el.button(
                         rx.icon("map", size=16, class_name="mr-2"),
                         "EXPLORE LOCATIONS",
-                        on_click=lambda: QuizState.set_page("locations"),
+                        on_click=rx.redirect(routes.LOCATIONS),
                         class_name="border-2 border-[#00ff9f] text-[#00ff9f] px-6 py-3 hover:bg-[#00ff9f] hover:text-black transition-colors font-bold tracking-wider flex items-center"
                     ),
                     class_name="w-full border-2 border-gray-800 p-12 flex flex-col items-center justify-center bg-[#1a1a2e]/40 backdrop-blur-sm"
@@ -154,5 +154,6 @@ def visited_locations_page() -> rx.Component:
 
             class_name="max-w-4xl mx-auto w-full flex flex-col"
         ),
+        on_mount=LocationState.refresh_community_ratings,
         class_name="min-h-screen retro-bg p-4 md:p-8 font-mono"
     )
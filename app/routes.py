@@ -0,0 +1,24 @@
+"""URL of every page.
+
+Each page is its own route, so the frontend only loads a page's code when it
+is first visited. Navigate with ``rx.redirect(<route>)`` from ``on_click``:
+it runs in the browser without a server round trip.
+"""
+import reflex as rx
+
+HOME = "/"
+QUIZ = "/quiz"
+LOCATIONS = "/locations"
+PROFILE = "/profile"
+ACHIEVEMENTS = "/achievements"
+VISITED_LOCATIONS = "/visited"
+
+
+def location_path(location_id: str | rx.Var[str]) -> str:
+    """Detail page URL for a location id or an id Var."""
+    return f"/location/{location_id}"
+
+
+def results_path(personality_type: str) -> str:
+    """Quiz result page URL for a ``PERSONALITIES`` key."""
+    return f"/results/{personality_type.lower()}"
@@ -0,0 +1,205 @@
+"""Declarative achievement rules.
+
+Each rule names the trigger it listens to, an optional predicate over that
+trigger's facts and how many matching events it takes. Rules are compiled
+into a trigger index at import, so an event only evaluates the rules
+subscribed to it. Collection rules ("check in at every library spot") are a
+single AND against the user's check-in bitmask; rules that count repeated
+events keep a per-user progress counter instead of rescanning lists.
+"""
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Literal, Mapping, MutableMapping, TypedDict
+
+from app.services.aggregates import is_s_rank
+from app.services.bitsets import BitIndex
+from app.services.catalog import CATALOG
+
+Trigger = Literal["rating", "first_rating", "rated_all", "check_in", "quiz_finished"]
+Facts = Mapping[str, Any]
+
+ACHIEVEMENT_XP = 200
+
+
+class Achievement(TypedDict):
+    id: str
+    title: str
+    description: str
+    icon: str
+
+
+# Order defines each achievement's bit in ACHIEVEMENT_BITS: append, never reorder.
+ACHIEVEMENTS: dict[str, Achievement] = {
+    "5-star-sleeper": {
+        "id": "5-star-sleeper",
+        "title": "5-Star Sleeper",
+        "description": "Rate a single location with a perfect 5-star score in all categories.",
+        "icon": "star",
+    },
+    "secret-spot-explorer": {
+        "id": "secret-spot-explorer",
+        "title": "Secret Spot Explorer",
+        "description": "Submit ratings for at least 3 different nap spots.",
+        "icon": "map-pin",
+    },
+    "all-area-conqueror": {
+        "id": "all-area-conqueror",
+        "title": "All-Area Conqueror",
+        "description": "Leave your mark by rating all available nap locations.",
+        "icon": "crown",
+    },
+    "nap-legend": {
+        "id": "nap-legend",
+        "title": "Nap Legend",
+        "description": "Complete the personality quiz and rate every single location. A true master of rest.",
+        "icon": "shield-check",
+    },
+    "living-on-the-edge": {
+        "id": "living-on-the-edge",
+        "title": "Living on the Edge",
+        "description": "Rate a location with maximum Danger level. You laugh in the face of peril.",
+        "icon": "skull",
+    },
+    "zen-master": {
+        "id": "zen-master",
+        "title": "Zen Master",
+        "description": "Find a spot with perfect Quietness. Inner peace achieved.",
+        "icon": "flower",
+    },
+    "social-sleeper": {
+        "id": "social-sleeper",
+        "title": "Social Sleeper",
+        "description": "Rate a spot that is loud but has immaculate vibes. Who needs quiet?",
+        "icon": "users",
+    },
+    "night-owl": {
+        "id": "night-owl",
+        "title": "The Night Owl",
+        "description": "Access the app during the witching hours (Late Night).",
+        "icon": "moon",
+    },
+    "secret-boss-defeated": {
+        "id": "secret-boss-defeated",
+        "title": "Secret Boss Defeated",
+        "description": "Discover the hidden nap spot. You found the easter egg.",
+        "icon": "ghost",
+    },
+    "library-legend": {
+        "id": "library-legend",
+        "title": "Library Legend",
+        "description": "Check in at all library locations (G floor study room, bookshelf corridor, and sofa).",
+        "icon": "book-open",
+    },
+    "outdoor-enthusiast": {
+        "id": "outdoor-enthusiast",
+        "title": "Outdoor Enthusiast",
+        "description": "Check in at all outdoor seating areas (wooden, dining, and stone chairs).",
+        "icon": "sun",
+    },
+    "jcit-master": {
+        "id": "jcit-master",
+        "title": "JCIT Master",
+        "description": "Check in at all JCIT locations (Milk Tea Shop, Stairwell, Study Room areas).",
+        "icon": "building",
+    },
+    "comfort-seeker": {
+        "id": "comfort-seeker",
+        "title": "Comfort Seeker",
+        "description": "Check in at all LEGENDARY rarity locations.",
+        "icon": "sofa",
+    },
+    "speed-napper": {
+        "id": "speed-napper",
+        "title": "Speed Napper",
+        "description": "Complete a quiz in under 2 minutes.",
+        "icon": "zap",
+    },
+}
+
+ACHIEVEMENT_BITS = BitIndex(ACHIEVEMENTS)
+
+LIBRARY_MASK = CATALOG.bits.mask(("cloud-nine-credit", "the-spynap-alley", "the-public-isolation"))
+OUTDOOR_MASK = CATALOG.bits.mask(("the-urban-zen", "the-shade-throne", "the-stonecold-zen"))
+JCIT_MASK = CATALOG.bits.mask(
+    ("the-bobafueled-snooze", "the-stairwell-stealth", "the-curtaincall-nap", "the-modular-dream")
+)
+LEGENDARY_MASK = CATALOG.bits.mask(CATALOG.ids_by_rarity("LEGENDARY"))
+SECRET_MASK = CATALOG.bits.mask(CATALOG.secret_ids)
+
+
+@dataclass(frozen=True, slots=True)
+class Rule:
+    """Unlock ``achievement_id`` after ``target`` ``trigger`` events pass ``predicate``."""
+    achievement_id: str
+    trigger: Trigger
+    predicate: Callable[[Facts], bool] | None = None
+    target: int = 1
+    xp: int = ACHIEVEMENT_XP
+
+    @property
+    def key(self) -> str:
+        return f"{self.achievement_id}:{self.trigger}"
+
+
+def _collection(achievement_id: str, mask: int) -> Rule:
+    return Rule(achievement_id, "check_in", lambda f: BitIndex.has_all(f["checked_in"], mask))
+
+
+RULES: tuple[Rule, ...] = (
+    Rule("5-star-sleeper", "rating", lambda f: is_s_rank(f["rating"])),
+    Rule("living-on-the-edge", "rating", lambda f: f["rating"]["danger"] == 5),
+    Rule("zen-master", "rating", lambda f: f["rating"]["quietness"] == 5),
+    Rule(
+        "social-sleeper",
+        "rating",
+        lambda f: f["rating"]["quietness"] == 1 and f["rating"]["vibe_check"] == 5,
+    ),
+    Rule("secret-spot-explorer", "first_rating", target=3),
+    Rule("all-area-conqueror", "rated_all"),
+    Rule("nap-legend", "rated_all", lambda f: f["quiz_finished"]),
+    Rule("nap-legend", "quiz_finished", lambda f: f["rated_all"]),
+    Rule("secret-spot-explorer", "check_in", lambda f: bool(f["location_bit"] & SECRET_MASK)),
+    Rule("secret-boss-defeated", "check_in", lambda f: bool(f["location_bit"] & SECRET_MASK)),
+    _collection("library-legend", LIBRARY_MASK),
+    _collection("outdoor-enthusiast", OUTDOOR_MASK),
+    _collection("jcit-master", JCIT_MASK),
+    _collection("comfort-seeker", LEGENDARY_MASK),
+)
+
+
+def compile_rules(rules: Iterable[Rule]) -> Mapping[str, tuple[tuple[Rule, int], ...]]:
+    """Index rules, paired with their achievement's bit, by trigger."""
+    index: dict[str, list[tuple[Rule, int]]] = {}
+    for rule in rules:
+        index.setdefault(rule.trigger, []).append((rule, ACHIEVEMENT_BITS.bit(rule.achievement_id)))
+    return MappingProxyType({trigger: tuple(group) for trigger, group in index.items()})
+
+
+RULES_BY_TRIGGER = compile_rules(RULES)
+
+
+def evaluate(
+    trigger: Trigger,
+    facts: Facts,
+    unlocked: int,
+    progress: MutableMapping[str, int],
+) -> list[Rule]:
+    """Advance the rules subscribed to ``trigger``; return the ones now earned.
+
+    ``unlocked`` is an ACHIEVEMENT_BITS mask; rules for achievements already
+    in it are skipped without evaluation. ``progress`` is updated in place
+    for multi-event rules.
+    """
+    earned = []
+    for rule, bit in RULES_BY_TRIGGER.get(trigger, ()):
+        if unlocked & bit:
+            continue
+        if rule.predicate is not None and not rule.predicate(facts):
+            continue
+        if rule.target > 1:
+            count = progress.get(rule.key, 0) + 1
+            progress[rule.key] = count
+            if count < rule.target:
+                continue
+        earned.append(rule)
+    return earned
@@ -0,0 +1,68 @@
+"""Running per-location rating aggregates.
+
+Totals are kept as plain ``{location_id: {category: sum, ..., "count": n}}``
+dicts so they can live directly in state vars. Adding a rating is O(1) and
+reading averages never touches individual ratings.
+"""
+from typing import Mapping
+
+from app.services.catalog import CATALOG, RATING_CATEGORIES
+
+COUNT_KEY = "count"
+
+
+def empty_totals() -> dict[str, int]:
+    totals = dict.fromkeys(RATING_CATEGORIES, 0)
+    totals[COUNT_KEY] = 0
+    return totals
+
+
+def add_rating(totals: dict[str, dict[str, int]], location_id: str, rating: Mapping[str, int]) -> None:
+    """Fold a single rating into ``totals`` in place."""
+    loc_totals = totals.get(location_id)
+    if loc_totals is None:
+        loc_totals = totals[location_id] = empty_totals()
+    for category in RATING_CATEGORIES:
+        loc_totals[category] += rating[category]
+    loc_totals[COUNT_KEY] += 1
+
+
+def is_s_rank(rating: Mapping[str, int]) -> bool:
+    return all(rating[category] == 5 for category in RATING_CATEGORIES)
+
+
+def location_averages(loc_totals: Mapping[str, int] | None, sample: Mapping[str, int]) -> dict[str, float]:
+    """Category averages plus ``overall``, falling back to the sample rating."""
+    count = loc_totals[COUNT_KEY] if loc_totals else 0
+    if not count:
+        averages = {c: float(sample[c]) for c in RATING_CATEGORIES}
+        averages["overall"] = round(sum(averages.values()) / len(RATING_CATEGORIES), 1)
+        return averages
+    raw = [loc_totals[c] / count for c in RATING_CATEGORIES]
+    averages = {c: round(v, 1) for c, v in zip(RATING_CATEGORIES, raw)}
+    averages["overall"] = round(sum(raw) / len(raw), 1)
+    return averages
+
+
+def all_averages(totals: Mapping[str, Mapping[str, int]]) -> dict[str, dict[str, float]]:
+    """Averages for every catalog location, keyed by id."""
+    return {
+        location.id: location_averages(totals.get(location.id), location.sample_rating)
+        for location in CATALOG
+    }
+
+
+def rating_count(totals: Mapping[str, Mapping[str, int]]) -> int:
+    return sum(t[COUNT_KEY] for t in totals.values())
+
+
+def overall_average(totals: Mapping[str, Mapping[str, int]]) -> float:
+    """Mean of every category value across every rating in ``totals``."""
+    values = 0
+    points = 0
+    for t in totals.values():
+        values += t[COUNT_KEY] * len(RATING_CATEGORIES)
+        points += sum(t[c] for c in RATING_CATEGORIES)
+    if not values:
+        return 0.0
+    return round(points / values, 1)
@@ -0,0 +1,57 @@
+"""Integer bitmasks over fixed id sequences.
+
+Per-user collections of catalog ids (check-ins, unlocked achievements) are
+stored as a single ``int`` with one bit per id, so membership, "has all of"
+and counts are a mask operation instead of a scan over string sets. Bit
+positions follow the sequence order; new ids must be appended so that
+previously serialized masks keep their meaning.
+"""
+from types import MappingProxyType
+from typing import Iterable
+
+
+class BitIndex:
+    """Dense bit positions for an append-only sequence of ids."""
+
+    __slots__ = ("_ids", "_bits", "_full")
+
+    def __init__(self, ids: Iterable[str]):
+        self._ids = tuple(ids)
+        self._bits = MappingProxyType({id_: 1 << i for i, id_ in enumerate(self._ids)})
+        self._full = (1 << len(self._ids)) - 1
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def bit(self, id_: str | None) -> int:
+        """The id's bit, or 0 for unknown ids."""
+        return self._bits.get(id_, 0)
+
+    def mask(self, ids: Iterable[str]) -> int:
+        mask = 0
+        for id_ in ids:
+            mask |= self._bits.get(id_, 0)
+        return mask
+
+    def ids(self, mask: int) -> list[str]:
+        """Ids whose bits are set, in sequence order."""
+        ids = []
+        mask &= self._full
+        while mask:
+            low = mask & -mask
+            ids.append(self._ids[low.bit_length() - 1])
+            mask ^= low
+        return ids
+
+    @staticmethod
+    def has_all(mask: int, required: int) -> bool:
+        return mask & required == required
+
+    @staticmethod
+    def to_hex(mask: int) -> str:
+        """Stable text form of a mask (lowercase hex, no prefix)."""
+        return format(mask, "x")
+
+    def from_hex(self, text: str) -> int:
+        """Parse ``to_hex`` output, dropping bits beyond the known ids."""
+        return int(text or "0", 16) & self._full
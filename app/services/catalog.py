@@ -0,0 +1,231 @@
+"""Process-wide, read-only catalog of nap spots.
+
+The catalog is built once at import time and shared by every session. States
+only keep location ids and resolve them through ``CATALOG``, so no session
+carries (or serializes) its own copy of the location data.
+"""
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Iterator, Mapping, TypedDict
+
+from app.services.bitsets import BitIndex
+
+
+class Rating(TypedDict):
+    comfort: int
+    quietness: int
+    accessibility: int
+    vibe_check: int
+    danger: int
+
+
+class Location(TypedDict):
+    id: str
+    location: str
+    name: str
+    description: str
+    icon: str
+    model_id: str
+    rarity: str
+    is_secret: bool
+    sample_rating: Rating
+
+
+RATING_CATEGORIES: tuple[str, ...] = ("comfort", "quietness", "accessibility", "vibe_check", "danger")
+
+
+@dataclass(frozen=True, slots=True)
+class LocationRecord:
+    """Immutable catalog entry for a single nap spot."""
+    id: str
+    location: str
+    name: str
+    description: str
+    icon: str
+    model_id: str
+    rarity: str
+    is_secret: bool
+    sample_rating: Mapping[str, int]
+
+    def to_dict(self) -> Location:
+        """Return a fresh, mutable copy suitable for a state var."""
+        return {
+            "id": self.id,
+            "location": self.location,
+            "name": self.name,
+            "description": self.description,
+            "icon": self.icon,
+            "model_id": self.model_id,
+            "rarity": self.rarity,
+            "is_secret": self.is_secret,
+            "sample_rating": dict(self.sample_rating),
+        }
+
+
+class LocationCatalog:
+    """Ordered collection of location records with an O(1) id index."""
+
+    __slots__ = ("_records", "_index", "_by_rarity", "_secret_ids", "_bits")
+
+    def __init__(self, locations: list[Location]):
+        self._records = tuple(
+            LocationRecord(
+                **{**loc, "sample_rating": MappingProxyType(dict(loc["sample_rating"]))}
+            )
+            for loc in locations
+        )
+        self._index = MappingProxyType({rec.id: i for i, rec in enumerate(self._records)})
+        by_rarity: dict[str, list[str]] = {}
+        for rec in self._records:
+            by_rarity.setdefault(rec.rarity, []).append(rec.id)
+        self._by_rarity = MappingProxyType({k: frozenset(v) for k, v in by_rarity.items()})
+        self._secret_ids = frozenset(rec.id for rec in self._records if rec.is_secret)
+        self._bits = BitIndex(rec.id for rec in self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[LocationRecord]:
+        return iter(self._records)
+
+    def __contains__(self, location_id: object) -> bool:
+        return location_id in self._index
+
+    def get(self, location_id: str | None) -> LocationRecord | None:
+        """Look up a record by id, or ``None`` if it is unknown."""
+        i = self._index.get(location_id)
+        return None if i is None else self._records[i]
+
+    @property
+    def ids(self) -> tuple[str, ...]:
+        return tuple(self._index)
+
+    @property
+    def bits(self) -> BitIndex:
+        """Bit per location in catalog order; append new locations at the end."""
+        return self._bits
+
+    @property
+    def secret_ids(self) -> frozenset[str]:
+        return self._secret_ids
+
+    def ids_by_rarity(self, rarity: str) -> frozenset[str]:
+        return self._by_rarity.get(rarity, frozenset())
+
+    def to_list(self) -> list[Location]:
+        """Plain-dict copy of the catalog, in order, for the frontend."""
+        return [rec.to_dict() for rec in self._records]
+
+
+CATALOG = LocationCatalog([
+    {
+        "id": "cloud-nine-credit",
+        "location": "Study room on the G floor of the library",
+        "name": "Cloud Nine Credit Charge",
+        "description": "Your demand for comfort rivals that of a five-star hotel sleep tester. Here, the sofa is a cloud, the power outlet is a magical spring. With stable Wi-Fi, you might even dream of being rewarded with credit hours.",
+        "icon": "sofa",
+        "model_id": "b67d3200015b48db9546fc8e2afd6168",
+        "rarity": "LEGENDARY",
+        "is_secret": False,
+        "sample_rating": {"comfort": 5, "quietness": 5, "accessibility": 3, "vibe_check": 3, "danger": 1}
+    },
+    {
+        "id": "the-spynap-alley",
+        "location": "The corridor of bookshelves on the G floor of the library",
+        "name": "The Spy-Nap Alley",
+        "description": "Your sleep here is like a footnote in a thesis—precise, brief, yet indispensable. Each time you close your eyes, it's like activating 'Deep Recovery Mode,' restoring 80% energy in 5 minutes. But, sleeping here... is this bookshelf about to fall over...?",
+        "icon": "zap",
+        "model_id": "d682b1a9ea2f4683914f9e6384dcb845",
+        "rarity": "EPIC",
+        "is_secret": False,
+        "sample_rating": {"comfort": 4, "quietness": 3, "accessibility": 4, "vibe_check": 3, "danger": 1}
+    },
+    {
+        "id": "the-public-isolation",
+        "location": "Sofa on the G floor of the library",
+        "name": "The Public Isolation Island",
+        "description": "This isn't a sofa; it's your 'Ergonomic Island.' People passing by? They're just the sightseers in your dream's bullet comments. You recharge your energy and your inspiration—waking up fully charged, with inspiration unlocked in a new skin.",
+        "icon": "sofa",
+        "model_id": "5d549bf015bf49f8add67eb74e86ad26",
+        "rarity": "LEGENDARY",
+        "is_secret": False,
+        "sample_rating": {"comfort": 4, "quietness": 4, "accessibility": 5, "vibe_check": 3, "danger": 1}
+    },
+    {
+        "id": "the-urban-zen",
+        "location": "Outdoor wooden chair",
+        "name": "The Urban Zen Bench",
+        "description": "You sleep on the city's pulse. The subway vibrations are white noise, the passing shadows are your dynamic screensaver. You're not napping outdoors; you're starring in a live performance of 'Urban Sleep Log.'",
+        "icon": "compass",
+        "model_id": "932a64b422a94be9bec6899d36c6f6ea",
+        "rarity": "UNCOMMON",
+        "is_secret": False,
+        "sample_rating": {"comfort": 2, "quietness": 2, "accessibility": 4, "vibe_check": 3, "danger": 1}
+    },
+    {
+        "id": "the-shade-throne",
+        "location": "Outdoor dining chair",
+        "name": "The Shade Throne",
+        "description": "Under the sunshade umbrella, you are your own shopkeeper. Occasionally someone studying? They're just extras in your dream~",
+        "icon": "compass",
+        "model_id": "0201608218144d65892e4f63647774d0",
+        "rarity": "UNCOMMON",
+        "is_secret": False,
+        "sample_rating": {"comfort": 3, "quietness": 3, "accessibility": 5, "vibe_check": 3, "danger": 1}
+    },
+    {
+        "id": "the-stonecold-zen",
+        "location": "Outdoor stone chair",
+        "name": "The Stone-Cold Zen Zone",
+        "description": "A four-person stone bench, you occupy one corner, the greenery is your screen. An occasional passerby? They're just forest spirits in your dream~",
+        "icon": "compass",
+        "model_id": "d33020d326bb4e6bbcf6043f6f5dfb1b",
+        "rarity": "UNCOMMON",
+        "is_secret": False,
+        "sample_rating": {"comfort": 1, "quietness": 1, "accessibility": 4, "vibe_check": 3, "danger": 1}
+    },
+    {
+        "id": "the-bobafueled-snooze",
+        "location": "JCIT Milk Tea Shop",
+        "name": "The Boba-Fueled Snooze Booth",
+        "description": "Fall asleep to the scent of milk tea, wake up at the round table. I will strategically choose the 'off-peak hours'!",
+        "icon": "bed-double",
+        "model_id": "6c59d214f3224a6b9fa9f135937ff3ff",
+        "rarity": "RARE",
+        "is_secret": False,
+        "sample_rating": {"comfort": 3, "quietness": 2, "accessibility": 3, "vibe_check": 3, "danger": 1}
+    },
+    {
+        "id": "the-stairwell-stealth",
+        "location": "JCIT Stairwell",
+        "name": "The Stairwell Stealth Suite",
+        "description": "The stench is your barrier, the emptiness is your dojo. No people, right? That's called 'Stealth Skill Activated'!",
+        "icon": "zap",
+        "model_id": "f0ca0a25820646bf9575d7e075aefae2",
+        "rarity": "EPIC",
+        "is_secret": False,
+        "sample_rating": {"comfort": 1, "quietness": 1, "accessibility": 2, "vibe_check": 3, "danger": 1}
+    },
+    {
+        "id": "the-curtaincall-nap",
+        "location": "JCIT Study Room Partition Area",
+        "name": "The Curtain-Call Nap Studio",
+        "description": "Curtain drawn, reclining on the small chair, game console on standby~ The people around are just the audience of your sleep livestream!",
+        "icon": "sofa",
+        "model_id": "b1c28102ab3a4a7193e7b89a2130a19f",
+        "rarity": "LEGENDARY",
+        "is_secret": False,
+        "sample_rating": {"comfort": 3, "quietness": 3, "accessibility": 4, "vibe_check": 3, "danger": 1}
+    },
+    {
+        "id": "the-modular-dream",
+        "location": "JCIT Study Room Sofa",
+        "name": "The Modular Dream Fort",
+        "description": "Modular sofas for you to arrange, the view outside for you to enjoy~ Just love the 'shared sleep experience'!",
+        "icon": "sofa",
+        "model_id": "85aa52c8637b42d18d7fb082bd11d265",
+        "rarity": "LEGENDARY",
+        "is_secret": False,
+        "sample_rating": {"comfort": 4, "quietness": 5, "accessibility": 5, "vibe_check": 3, "danger": 1}
+    },
+])
@@ -0,0 +1,67 @@
+"""HMAC-signed, time-bucketed check-in tokens carried by location QR codes.
+
+A token is ``<bucket>.<signature>`` where the bucket is the number of
+``TOKEN_DAYS`` periods since the epoch and the signature is a truncated
+HMAC-SHA256 of ``<location_id>:<bucket>``. Verification is a single HMAC over
+a few bytes with a pre-keyed hasher; no database is involved. Tokens from the
+current and the previous bucket are accepted so printed stickers stay valid
+across a bucket boundary.
+
+The key comes from ``POLYUNAP_CHECKIN_SECRET`` and must be the one the stickers
+were printed with, on every worker. Production (``REFLEX_ENV_MODE=prod``)
+refuses to start without it; development falls back to a per-process key
+with a warning.
+"""
+import base64
+import hashlib
+import hmac
+import os
+import secrets
+import time
+import warnings
+
+TOKEN_DAYS = int(os.environ.get("POLYUNAP_CHECKIN_TOKEN_DAYS", "120"))
+BUCKET_SECONDS = TOKEN_DAYS * 24 * 60 * 60
+SIGNATURE_BYTES = 12
+
+_SECRET = os.environ.get("POLYUNAP_CHECKIN_SECRET", "").encode()
+if not _SECRET:
+    if os.environ.get("REFLEX_ENV_MODE") == "prod":
+        raise RuntimeError(
+            "POLYUNAP_CHECKIN_SECRET must be set in production so printed QR codes verify"
+        )
+    warnings.warn(
+        "POLYUNAP_CHECKIN_SECRET is not set; check-in tokens only verify in this process",
+        RuntimeWarning,
+        stacklevel=2,
+    )
+    _SECRET = secrets.token_bytes(32)
+_KEYED = hmac.new(_SECRET, digestmod=hashlib.sha256)
+
+
+def current_bucket(now: float | None = None) -> int:
+    return int((time.time() if now is None else now) // BUCKET_SECONDS)
+
+
+def _signature(location_id: str, bucket: int) -> str:
+    mac = _KEYED.copy()
+    mac.update(f"{location_id}:{bucket}".encode())
+    return base64.urlsafe_b64encode(mac.digest()[:SIGNATURE_BYTES]).decode()
+
+
+def issue_token(location_id: str, bucket: int | None = None) -> str:
+    if bucket is None:
+        bucket = current_bucket()
+    return f"{bucket}.{_signature(location_id, bucket)}"
+
+
+def verify_token(location_id: str, token: str, now: float | None = None) -> bool:
+    """Whether ``token`` was issued for ``location_id`` in a live bucket."""
+    bucket_str, _, signature = token.partition(".")
+    # str.isdigit alone accepts digits like '²' that int() rejects.
+    if not (bucket_str.isascii() and bucket_str.isdigit()) or not signature.isascii():
+        return False
+    bucket = int(bucket_str)
+    if current_bucket(now) - bucket not in (0, 1):
+        return False
+    return hmac.compare_digest(signature, _signature(location_id, bucket))
@@ -0,0 +1,93 @@
+"""Shared SQLite access for process-wide stores.
+
+Connections are opened lazily in WAL mode and handed out from a small pool.
+Blocking SQLite calls run on a dedicated thread pool of the same size, so
+``await POOL.run(...)`` never blocks the event loop or waits on a connection.
+"""
+import asyncio
+import os
+import queue
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+DB_PATH = os.environ.get("POLYUNAP_DB_PATH", "polyunap.db")
+POOL_SIZE = int(os.environ.get("POLYUNAP_DB_POOL_SIZE", "4"))
+
+
+class ConnectionPool:
+    """Fixed-size pool of SQLite connections plus the threads that use them."""
+
+    def __init__(self, path: str, size: int = 4):
+        self._path = path
+        self._size = size
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._schemas: set[str] = set()
+        self._schema_lock = asyncio.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._path, timeout=5.0, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection, opening a new one while under the pool size."""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                grow = self._created < self._size
+                if grow:
+                    self._created += 1
+            conn = self._connect() if grow else self._idle.get()
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    def _call(self, fn: Callable[..., T], args: tuple) -> T:
+        with self.connection() as conn:
+            return fn(conn, *args)
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        """Run ``fn(conn, *args)`` on a pooled connection off the event loop."""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(self._size, thread_name_prefix="sqlite")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._call, fn, args)
+
+    async def ensure_schema(self, script: str) -> None:
+        """Run a ``CREATE ... IF NOT EXISTS`` script once per pool."""
+        if script in self._schemas:
+            return
+        async with self._schema_lock:
+            if script not in self._schemas:
+                await self.run(lambda conn: conn.executescript(script))
+                self._schemas.add(script)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+        self._created = 0
+        self._schemas.clear()
+
+
+POOL = ConnectionPool(DB_PATH, POOL_SIZE)
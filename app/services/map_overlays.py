@@ -0,0 +1,33 @@
+"""Highlight variants of the campus map stored as overlays on the base map.
+
+The ``Main map`` images are the campus map with one spot or building
+highlighted. ``build_map_overlays.py`` keeps only the pixels each one changes,
+cropped to their bounding box, so pages draw the (cached) base map and a
+small transparent overlay on top. Variants identical to the base map have no
+overlay at all.
+"""
+import json
+from pathlib import Path
+
+OVERLAYS_DIR = Path(__file__).resolve().parents[2] / "assets" / "overlays"
+OVERLAYS_URL = "/overlays"
+MANIFEST_PATH = OVERLAYS_DIR / "manifest.json"
+BASE_MAP = "/map images/POLYU MAP.png"
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> dict[str, dict]:
+    try:
+        return json.loads(path.read_text())
+    except FileNotFoundError:
+        return {}
+
+
+OVERLAYS = load_manifest()
+
+
+def variant_for(label: str) -> str | None:
+    """URL of the variant highlighting ``label`` (a spot or building name)."""
+    for src, entry in OVERLAYS.items():
+        if entry["label"] == label:
+            return src
+    return None
@@ -0,0 +1,38 @@
+"""Tile pyramids cut by ``build_map_tiles.py``.
+
+Each pyramid stores a map image as ``tile_size`` square WebP tiles at zoom
+levels ``0..max_zoom``. Level ``max_zoom`` is full resolution, each level
+below halves it, and level 0 fits in a single tile. The manifest is keyed by
+the original image's URL; maps without an entry fall back to the plain image.
+"""
+import json
+from pathlib import Path
+
+TILES_DIR = Path(__file__).resolve().parents[2] / "assets" / "tiles"
+TILES_URL = "/tiles"
+MANIFEST_PATH = TILES_DIR / "manifest.json"
+TILE_SIZE = 256
+
+
+def max_zoom(width: int, height: int, tile_size: int = TILE_SIZE) -> int:
+    """Levels above 0 needed before the image is shown at full resolution."""
+    zoom = 0
+    while max(width, height) > tile_size << zoom:
+        zoom += 1
+    return zoom
+
+
+def level_size(width: int, height: int, zoom: int, top: int) -> tuple[int, int]:
+    """Pixel size of level ``zoom`` in a pyramid whose top level is ``top``."""
+    factor = 1 << (top - zoom)
+    return -(-width // factor), -(-height // factor)
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> dict[str, dict]:
+    try:
+        return json.loads(path.read_text())
+    except FileNotFoundError:
+        return {}
+
+
+PYRAMIDS = load_manifest()
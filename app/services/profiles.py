@@ -0,0 +1,237 @@
+"""Persistent user profiles keyed by a stable per-browser token.
+
+Session state only lives as long as the Reflex session; a user's progress is
+mirrored here so it survives expiry and deploys. Writes are buffered: each
+``update`` merges changed fields into a per-token pending row and ``append_xp``
+queues new ledger entries, and a lifespan task flushes everything pending in
+one transaction at most every ``delay`` seconds. ``load`` overlays pending
+changes on the stored row so a reload before a flush still sees them; it
+shares a lock with ``flush`` so it never reads between a buffer swap and the
+write that persists it.
+
+Bitmasks are stored in ``BitIndex.to_hex`` form and the XP ledger is its own
+append-only table, so saving never rewrites past XP entries.
+"""
+import asyncio
+import contextlib
+import json
+import os
+import secrets
+import sqlite3
+import time
+from dataclasses import dataclass, field, fields
+from typing import Any, AsyncIterator, Iterable
+
+from app.services.achievements import ACHIEVEMENT_BITS
+from app.services.catalog import CATALOG
+from app.services.db import POOL, ConnectionPool
+from app.services.xp_ledger import STARTING_TITLE, LedgerEntry
+
+FLUSH_DELAY = float(os.environ.get("POLYUNAP_PROFILE_FLUSH_SECONDS", "2.0"))
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS profiles (
+    token TEXT PRIMARY KEY,
+    gamertag TEXT NOT NULL DEFAULT '',
+    current_title TEXT NOT NULL DEFAULT '{STARTING_TITLE}',
+    unlocked TEXT NOT NULL DEFAULT '0',
+    achievement_progress TEXT NOT NULL DEFAULT '{{}}',
+    checked_in TEXT NOT NULL DEFAULT '0',
+    rating_totals TEXT NOT NULL DEFAULT '{{}}',
+    s_rank_total INTEGER NOT NULL DEFAULT 0,
+    quiz_completed INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS xp_ledger (
+    token TEXT NOT NULL,
+    key TEXT NOT NULL,
+    source TEXT NOT NULL,
+    amount INTEGER NOT NULL,
+    at REAL NOT NULL,
+    PRIMARY KEY (token, key)
+) WITHOUT ROWID;
+"""
+
+
+@dataclass(slots=True)
+class Profile:
+    """Everything persisted for one user token."""
+    gamertag: str = ""
+    current_title: str = STARTING_TITLE
+    unlocked: int = 0
+    achievement_progress: dict[str, int] = field(default_factory=dict)
+    checked_in: int = 0
+    rating_totals: dict[str, dict[str, int]] = field(default_factory=dict)
+    s_rank_total: int = 0
+    quiz_completed: bool = False
+    xp_ledger: list[LedgerEntry] = field(default_factory=list)
+
+
+# Profile fields stored as profiles columns, and how each is encoded.
+_ENCODE = {
+    "gamertag": str,
+    "current_title": str,
+    "unlocked": ACHIEVEMENT_BITS.to_hex,
+    "achievement_progress": json.dumps,
+    "checked_in": CATALOG.bits.to_hex,
+    "rating_totals": json.dumps,
+    "s_rank_total": int,
+    "quiz_completed": int,
+}
+_DECODE = {
+    "gamertag": str,
+    "current_title": str,
+    "unlocked": ACHIEVEMENT_BITS.from_hex,
+    "achievement_progress": json.loads,
+    "checked_in": CATALOG.bits.from_hex,
+    "rating_totals": json.loads,
+    "s_rank_total": int,
+    "quiz_completed": bool,
+}
+_COLUMNS = tuple(_ENCODE)
+
+assert set(_COLUMNS) | {"xp_ledger"} == {f.name for f in fields(Profile)}
+
+
+def new_user_token() -> str:
+    return secrets.token_urlsafe(18)
+
+
+def _select(conn: sqlite3.Connection, token: str) -> tuple[tuple | None, list[tuple]]:
+    row = conn.execute(
+        f"SELECT {', '.join(_COLUMNS)} FROM profiles WHERE token = ?", (token,)
+    ).fetchone()
+    ledger = conn.execute(
+        "SELECT source, amount, key, at FROM xp_ledger WHERE token = ? ORDER BY at", (token,)
+    ).fetchall()
+    return row, ledger
+
+
+def _write(
+    conn: sqlite3.Connection,
+    rows: list[tuple[str, dict[str, Any]]],
+    ledger: list[tuple[str, str, str, int, float]],
+) -> None:
+    now = time.time()
+    # One statement per distinct set of changed columns.
+    groups: dict[tuple[str, ...], list[tuple]] = {}
+    for token, changes in rows:
+        columns = tuple(c for c in _COLUMNS if c in changes)
+        groups.setdefault(columns, []).append(
+            (token, *(_ENCODE[c](changes[c]) for c in columns), now)
+        )
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
+        for columns, params in groups.items():
+            names = ", ".join(columns)
+            placeholders = ", ".join("?" * len(columns))
+            updates = "".join(f"{c} = excluded.{c}, " for c in columns)
+            conn.executemany(
+                f"INSERT INTO profiles (token, {names}, updated_at) VALUES (?, {placeholders}, ?) "
+                f"ON CONFLICT (token) DO UPDATE SET {updates}updated_at = excluded.updated_at",
+                params,
+            )
+        conn.executemany(
+            "INSERT OR IGNORE INTO xp_ledger (token, key, source, amount, at) VALUES (?, ?, ?, ?, ?)",
+            ledger,
+        )
+
+
+class ProfileStore:
+    """Profile reads plus debounced, batched profile writes."""
+
+    def __init__(self, pool: ConnectionPool, delay: float = 2.0):
+        self._pool = pool
+        self._delay = delay
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._pending_ledger: dict[str, list[LedgerEntry]] = {}
+        self._wake = asyncio.Event()
+        # Held by flush from the buffer swap until the write commits, and by
+        # load around its read, so a load sees each change in one or the other.
+        self._io_lock = asyncio.Lock()
+
+    async def load(self, token: str) -> Profile | None:
+        """The stored profile with unflushed changes applied, or ``None``."""
+        await self._pool.ensure_schema(SCHEMA)
+        async with self._io_lock:
+            row, ledger = await self._pool.run(_select, token)
+            pending = dict(self._pending.get(token, {}))
+            pending_ledger = list(self._pending_ledger.get(token, []))
+        if row is None and not pending and not pending_ledger:
+            return None
+        profile = Profile()
+        if row is not None:
+            for column, value in zip(_COLUMNS, row):
+                setattr(profile, column, _DECODE[column](value))
+        for column, value in (pending or {}).items():
+            setattr(profile, column, value)
+        profile.xp_ledger = [LedgerEntry(*entry) for entry in ledger]
+        stored_keys = {entry.key for entry in profile.xp_ledger}
+        profile.xp_ledger.extend(e for e in pending_ledger if e.key not in stored_keys)
+        return profile
+
+    def update(self, token: str, **changes: Any) -> None:
+        """Queue changed profile fields for the next flush."""
+        unknown = changes.keys() - _ENCODE.keys()
+        if unknown:
+            raise ValueError(f"Unknown profile fields: {sorted(unknown)}")
+        self._pending.setdefault(token, {}).update(changes)
+        self._wake.set()
+
+    def append_xp(self, token: str, entries: Iterable[LedgerEntry]) -> None:
+        """Queue new ledger entries for the next flush."""
+        self._pending_ledger.setdefault(token, []).extend(entries)
+        self._wake.set()
+
+    async def flush(self) -> None:
+        """Write everything pending in one transaction."""
+        if not self._pending and not self._pending_ledger:
+            return
+        await self._pool.ensure_schema(SCHEMA)
+        async with self._io_lock:
+            # Swap the buffers before awaiting so new changes land in fresh ones.
+            pending, self._pending = self._pending, {}
+            pending_ledger, self._pending_ledger = self._pending_ledger, {}
+            ledger = [
+                (token, e.key, e.source, e.amount, e.at)
+                for token, entries in pending_ledger.items()
+                for e in entries
+            ]
+            try:
+                await self._pool.run(_write, list(pending.items()), ledger)
+            except Exception:
+                # Put the batch back underneath anything queued meanwhile.
+                for token, changes in pending.items():
+                    self._pending[token] = {**changes, **self._pending.get(token, {})}
+                for token, entries in pending_ledger.items():
+                    self._pending_ledger[token] = entries + self._pending_ledger.get(token, [])
+                raise
+
+    async def run(self) -> None:
+        """Flush at most once per ``delay`` while changes keep arriving."""
+        while True:
+            await self._wake.wait()
+            await asyncio.sleep(self._delay)
+            self._wake.clear()
+            try:
+                await self.flush()
+            except sqlite3.Error:
+                # Left pending; retried on the next wake-up.
+                self._wake.set()
+
+
+PROFILES = ProfileStore(POOL, FLUSH_DELAY)
+
+
+@contextlib.asynccontextmanager
+async def profile_writer() -> AsyncIterator[None]:
+    """Lifespan task running the flush loop and flushing on shutdown."""
+    task = asyncio.create_task(PROFILES.run())
+    try:
+        yield
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+        await PROFILES.flush()
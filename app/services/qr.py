@@ -0,0 +1,39 @@
+"""QR code rendering for the printed location stickers.
+
+A location's QR code is a deep link to ``/location/<location_id>?t=<token>``
+with a signed token (see ``checkin_tokens``), so it changes once per token
+bucket. The codes hold a valid check-in token and are only rendered by
+``generate_qr_posters.py``, never served by the app.
+"""
+import os
+
+import qrcode
+from PIL import Image
+
+from app import routes
+from app.services.checkin_tokens import issue_token
+
+# Bump when the QR styling changes so printed stickers are re-rendered.
+QR_STYLE_VERSION = 1
+
+FILL_COLOR = "#00ff9f"
+BACK_COLOR = "#0a0a0f"
+
+PUBLIC_URL = os.environ.get("POLYUNAP_PUBLIC_URL", "https://poly-u-nap.reflex.run").rstrip("/")
+
+
+def location_qr_data(location_id: str, bucket: int | None = None) -> str:
+    """Check-in deep link encoded in a location's QR code."""
+    return f"{PUBLIC_URL}{routes.location_path(location_id)}?t={issue_token(location_id, bucket)}"
+
+
+def render_qr(data: str, box_size: int = 8, border: int = 2) -> Image.Image:
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        box_size=box_size,
+        border=border,
+    )
+    qr.add_data(data)
+    qr.make(fit=True)
+    return qr.make_image(fill_color=FILL_COLOR, back_color=BACK_COLOR).get_image()
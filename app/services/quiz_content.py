@@ -0,0 +1,226 @@
+"""Static sleep-personality quiz content shared by every session."""
+from typing import TypedDict
+
+
+class Choice(TypedDict):
+    title: str
+    emoji: str
+    points: dict[str, int]
+
+
+class Question(TypedDict):
+    id: str
+    part: str
+    text: str
+    choices: dict[str, Choice]
+    layout: str | None
+
+
+class Personality(TypedDict):
+    title: str
+    description: str
+    icon: str
+
+
+# Six questions, all with four choices.
+QUESTIONS: list[Question] = [
+    {
+        "id": "q1",
+        "part": "The Nap Environment",
+        "text": "What level of noise is perfect for your nap?",
+        "layout": "grid",
+        "choices": {
+            "A": {
+                "title": "Silent as a tomb (Noise is the enemy)",
+                "emoji": "🤫",
+                "points": {"R": 2},
+            },
+            "B": {
+                "title": "A low, constant hum (Background chatter is calming)",
+                "emoji": "☕",
+                "points": {"S": 2},
+            },
+            "C": {
+                "title": "Anything goes (I can tune out a marching band)",
+                "emoji": "🎧",
+                "points": {"A": 2},
+            },
+            "D": {
+                "title": "Quiet, but I prefer natural white noise (Rain, fan)",
+                "emoji": "🍃",
+                "points": {"C": 1, "R": 1},
+            },
+        },
+    },
+    {
+        "id": "q2",
+        "part": "The Nap Environment",
+        "text": "How do you feel about napping in public view?",
+        "layout": "grid",
+        "choices": {
+            "A": {
+                "title": "Anxiety-inducing. I need total privacy.",
+                "emoji": "🥷",
+                "points": {"C": 2},
+            },
+            "B": {
+                "title": "Slightly thrilling. The risk is part of the fun.",
+                "emoji": "😎",
+                "points": {"S": 2},
+            },
+            "C": {
+                "title": "It's fine, as long as I'm in a designated spot.",
+                "emoji": "📜",
+                "points": {"R": 2},
+            },
+            "D": {
+                "title": "Don't care. I'll nap right in the middle of a crowd.",
+                "emoji": "🏙️",
+                "points": {"A": 2},
+            },
+        },
+    },
+    {
+        "id": "q3",
+        "part": "The Nap Surface",
+        "text": "Your ideal nap surface is...",
+        "layout": "grid",
+        "choices": {
+            "A": {
+                "title": "A plush cloud I can sink into (Ultimate softness)",
+                "emoji": "☁️",
+                "points": {"C": 2},
+            },
+            "B": {
+                "title": "Firm and supportive (Good for posture, not too squishy)",
+                "emoji": "🪵",
+                "points": {"R": 1, "A": 1},
+            },
+            "C": {
+                "title": "Whatever's closest (Back of a chair, desk, floor, etc.)",
+                "emoji": "🪨",
+                "points": {"A": 2},
+            },
+            "D": {
+                "title": "A high vantage point (I like to survey my kingdom)",
+                "emoji": "🏰",
+                "points": {"S": 2},
+            },
+        },
+    },
+    {
+        "id": "q4",
+        "part": "The Nap Surface",
+        "text": "How much 'gear' do you bring to a nap?",
+        "choices": {
+            "A": {
+                "title": "Everything: Mask, pillow, special blanket, earplugs.",
+                "emoji": "🎒",
+                "points": {"C": 1, "R": 2},
+            },
+            "B": {
+                "title": "Maybe a hoodie/bag for a makeshift pillow.",
+                "emoji": "🧣",
+                "points": {"S": 2},
+            },
+            "C": {
+                "title": "Nothing. I use what's available.",
+                "emoji": "🤷",
+                "points": {"A": 2},
+            },
+            "D": {
+                "title": "Just headphones (Music is my blanket)",
+                "emoji": "🎧",
+                "points": {"C": 1, "S": 1},
+            },
+        },
+    },
+    {
+        "id": "q5",
+        "part": "The Nap Schedule",
+        "text": "A good nap happens when...",
+        "choices": {
+            "A": {
+                "title": "It's exactly 2:00 PM (Precision timing is key).",
+                "emoji": "⏰",
+                "points": {"R": 2},
+            },
+            "B": {
+                "title": "I'm suddenly tired and have an unexpected opportunity.",
+                "emoji": "⚡",
+                "points": {"S": 2, "A": 1},
+            },
+            "C": {
+                "title": "I've carved out a comfortable block of at least 60-90 minutes.",
+                "emoji": "🛌",
+                "points": {"C": 2},
+            },
+            "D": {
+                "title": "Whenever I blink for too long (Accidental nap)",
+                "emoji": "😑",
+                "points": {"A": 2},
+            },
+        },
+    },
+    {
+        "id": "q6",
+        "part": "The Nap Schedule",
+        "text": "If your favorite spot is taken, you...",
+        "layout": "grid",
+        "choices": {
+            "A": {
+                "title": "Get mad and refuse to nap until tomorrow (Only the best will do).",
+                "emoji": "😠",
+                "points": {"R": 2},
+            },
+            "B": {
+                "title": "Explore until I find a new, novel, or fun place to try.",
+                "emoji": "🗺️",
+                "points": {"A": 2, "S": 1},
+            },
+            "C": {
+                "title": "Find the *next* most comfortable place immediately.",
+                "emoji": "🛋️",
+                "points": {"C": 2},
+            },
+            "D": {
+                "title": "Ask if they want to share (Nap party)",
+                "emoji": "👯",
+                "points": {"S": 2},
+            },
+        },
+    },
+]
+
+PERSONALITIES: dict[str, Personality] = {
+    "S": {
+        "title": "The Thrill Napper",
+        "description": "You thrive on the buzz of activity. A low hum of noise, people moving, and the slight risk of being noticed actually helps you drift off. **Your nap is a covert mission.**",
+        "icon": "ghost",
+    },
+    "C": {
+        "title": "The Comfort Connoisseur",
+        "description": "Your non-negotiable is comfort. You need plush surfaces, darkness, and a controlled temperature. You seek an immersive, private cocoon for your deepest rest.",
+        "icon": "couch",
+    },
+    "R": {
+        "title": "The Precision Planner",
+        "description": "Napping is a dedicated, controlled ritual. You need a designated, quiet space with minimal interruption to maximize efficiency. **Order equals rest.**",
+        "icon": "alarm-clock-check",
+    },
+    "A": {
+        "title": "The Spontaneous Drifter",
+        "description": "You are a master of napping anywhere, anytime. Conditions don't matter; convenience and opportunity do. The world is your bed.",
+        "icon": "earth",
+    },
+    "SR": {
+        "title": "The Stealth Scholar",
+        "description": "A rare blend of routine and risk. You want a quiet, controlled setting but crave the mild stimulation of a public, studious environment.",
+        "icon": "book-user",
+    },
+    "Default": {
+        "title": "Calculating Persona...",
+        "description": "Your unique sleep profile is being analyzed by our highly-trained digital gnomes.",
+        "icon": "loader",
+    },
+}
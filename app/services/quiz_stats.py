@@ -0,0 +1,117 @@
+"""Campus-wide quiz answer counters.
+
+Answers are counted in an in-process buffer (a plain ``Counter`` bump on the
+event loop, no lock), which is folded into the ``quiz_answer_counts`` table
+when the cached percentages expire, and by the ``quiz_stats_writer`` lifespan
+task on shutdown. The results page only ever reads those cached percentages,
+never raw answers.
+"""
+import contextlib
+import sqlite3
+import time
+from collections import Counter
+from typing import AsyncIterator, Callable, TypeVar
+
+from app.services.db import POOL, ConnectionPool
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS quiz_answer_counts (
+    question_id TEXT NOT NULL,
+    choice TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (question_id, choice)
+) WITHOUT ROWID;
+"""
+
+T = TypeVar("T")
+
+
+def _add_counts(conn: sqlite3.Connection, pending: list[tuple[str, str, int]]) -> None:
+    conn.executemany(
+        "INSERT INTO quiz_answer_counts (question_id, choice, count) VALUES (?, ?, ?) "
+        "ON CONFLICT (question_id, choice) DO UPDATE SET count = count + excluded.count",
+        pending,
+    )
+
+
+def _flush(conn: sqlite3.Connection, pending: list[tuple[str, str, int]]) -> None:
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
+        _add_counts(conn, pending)
+
+
+def _flush_and_select(conn: sqlite3.Connection, pending: list[tuple[str, str, int]]) -> list[tuple[str, str, int]]:
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
+        _add_counts(conn, pending)
+        return conn.execute("SELECT question_id, choice, count FROM quiz_answer_counts").fetchall()
+
+
+def to_percentages(
+    counts: dict[str, dict[str, int]], choices: dict[str, list[str]]
+) -> dict[str, dict[str, int]]:
+    """Whole-number share of each choice per question; uniform with no data."""
+    stats = {}
+    for question_id, keys in choices.items():
+        question_counts = counts.get(question_id, {})
+        total = sum(question_counts.get(k, 0) for k in keys)
+        if not total:
+            stats[question_id] = {k: round(100 / len(keys)) for k in keys}
+        else:
+            stats[question_id] = {k: round(100 * question_counts.get(k, 0) / total) for k in keys}
+    return stats
+
+
+class QuizStats:
+    """Answer counters with write-behind persistence and TTL-cached reads."""
+
+    def __init__(self, pool: ConnectionPool, ttl: float = 10.0):
+        self._pool = pool
+        self._ttl = ttl
+        self._pending: Counter[tuple[str, str]] = Counter()
+        self._percentages: dict[str, dict[str, int]] = {}
+        self._loaded_at = float("-inf")
+
+    def record(self, question_id: str, choice: str) -> None:
+        self._pending[(question_id, choice)] += 1
+
+    async def _write_pending(self, fn: Callable[..., T]) -> T:
+        # Swap the buffer before awaiting so new answers land in a fresh one.
+        pending, self._pending = self._pending, Counter()
+        await self._pool.ensure_schema(SCHEMA)
+        try:
+            return await self._pool.run(fn, [(q, c, n) for (q, c), n in pending.items()])
+        except Exception:
+            self._pending.update(pending)
+            raise
+
+    async def flush(self) -> None:
+        """Write buffered answers without reading the totals back."""
+        if self._pending:
+            await self._write_pending(_flush)
+
+    async def _refresh(self) -> dict[str, dict[str, int]]:
+        rows = await self._write_pending(_flush_and_select)
+        counts: dict[str, dict[str, int]] = {}
+        for question_id, choice, count in rows:
+            counts.setdefault(question_id, {})[choice] = count
+        return counts
+
+    async def percentages(self, choices: dict[str, list[str]]) -> dict[str, dict[str, int]]:
+        """``{question_id: {choice: percent}}`` across every user, cached for ``ttl``."""
+        if time.monotonic() - self._loaded_at > self._ttl:
+            self._percentages = to_percentages(await self._refresh(), choices)
+            self._loaded_at = time.monotonic()
+        return {q: dict(p) for q, p in self._percentages.items()}
+
+
+QUIZ_STATS = QuizStats(POOL)
+
+
+@contextlib.asynccontextmanager
+async def quiz_stats_writer() -> AsyncIterator[None]:
+    """Lifespan task flushing buffered answers on shutdown."""
+    try:
+        yield
+    finally:
+        await QUIZ_STATS.flush()
@@ -0,0 +1,107 @@
+"""Campus-wide ratings shared by every user.
+
+Each submission is appended to the ``ratings`` table; an insert trigger keeps
+``rating_totals`` (one row per location) up to date, so community averages
+are read from a handful of rows instead of scanning every rating. A copy of
+those totals is mirrored in memory and refreshed from the database after
+``max_age`` seconds to pick up writes from other workers. Totals only grow,
+so when concurrent reads and inserts finish out of order the row with the
+larger count wins.
+"""
+import sqlite3
+import time
+from typing import Mapping
+
+from app.services.catalog import RATING_CATEGORIES
+from app.services.db import POOL, ConnectionPool
+
+_COLUMNS = ", ".join(RATING_CATEGORIES)
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS ratings (
+    id INTEGER PRIMARY KEY,
+    location_id TEXT NOT NULL,
+    {", ".join(f"{c} INTEGER NOT NULL" for c in RATING_CATEGORIES)},
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_ratings_location_id ON ratings (location_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_ratings_created_at ON ratings (created_at);
+
+CREATE TABLE IF NOT EXISTS rating_totals (
+    location_id TEXT PRIMARY KEY,
+    {", ".join(f"{c} INTEGER NOT NULL DEFAULT 0" for c in RATING_CATEGORIES)},
+    count INTEGER NOT NULL DEFAULT 0
+);
+CREATE TRIGGER IF NOT EXISTS trg_ratings_totals AFTER INSERT ON ratings
+BEGIN
+    INSERT INTO rating_totals (location_id, {_COLUMNS}, count)
+    VALUES (NEW.location_id, {", ".join(f"NEW.{c}" for c in RATING_CATEGORIES)}, 1)
+    ON CONFLICT (location_id) DO UPDATE SET
+        {", ".join(f"{c} = {c} + excluded.{c}" for c in RATING_CATEGORIES)},
+        count = count + 1;
+END;
+"""
+
+
+def _row_to_totals(row: tuple) -> dict[str, int]:
+    totals = dict(zip(RATING_CATEGORIES, row[1:-1]))
+    totals["count"] = row[-1]
+    return totals
+
+
+def _insert(conn: sqlite3.Connection, location_id: str, values: tuple[int, ...], created_at: float) -> dict[str, int]:
+    placeholders = ", ".join("?" * len(RATING_CATEGORIES))
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute(
+            f"INSERT INTO ratings (location_id, {_COLUMNS}, created_at) VALUES (?, {placeholders}, ?)",
+            (location_id, *values, created_at),
+        )
+        row = conn.execute(
+            f"SELECT location_id, {_COLUMNS}, count FROM rating_totals WHERE location_id = ?",
+            (location_id,),
+        ).fetchone()
+    return _row_to_totals(row)
+
+
+def _select_totals(conn: sqlite3.Connection) -> dict[str, dict[str, int]]:
+    rows = conn.execute(f"SELECT location_id, {_COLUMNS}, count FROM rating_totals").fetchall()
+    return {row[0]: _row_to_totals(row) for row in rows}
+
+
+class RatingsStore:
+    """Async facade over the shared ratings tables."""
+
+    def __init__(self, pool: ConnectionPool, max_age: float = 2.0):
+        self._pool = pool
+        self._max_age = max_age
+        self._totals: dict[str, dict[str, int]] = {}
+        self._loaded_at = float("-inf")
+
+    def _merge(self, location_id: str, totals: dict[str, int]) -> None:
+        """Keep ``totals`` unless a newer row (larger count) is already cached."""
+        current = self._totals.get(location_id)
+        if current is None or totals["count"] >= current["count"]:
+            self._totals[location_id] = totals
+
+    def _snapshot(self) -> dict[str, dict[str, int]]:
+        return {loc_id: dict(totals) for loc_id, totals in self._totals.items()}
+
+    async def add(self, location_id: str, rating: Mapping[str, int]) -> dict[str, dict[str, int]]:
+        """Persist a rating and return the updated community totals."""
+        await self._pool.ensure_schema(SCHEMA)
+        values = tuple(int(rating[c]) for c in RATING_CATEGORIES)
+        self._merge(location_id, await self._pool.run(_insert, location_id, values, time.time()))
+        return self._snapshot()
+
+    async def totals(self) -> dict[str, dict[str, int]]:
+        """Community ``{location_id: {category: sum, "count": n}}`` totals."""
+        if time.monotonic() - self._loaded_at > self._max_age:
+            await self._pool.ensure_schema(SCHEMA)
+            for location_id, totals in (await self._pool.run(_select_totals)).items():
+                self._merge(location_id, totals)
+            self._loaded_at = time.monotonic()
+        return self._snapshot()
+
+
+RATINGS_STORE = RatingsStore(POOL)
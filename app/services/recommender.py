@@ -0,0 +1,75 @@
+"""Persona-to-spot recommendations.
+
+Each location's community averages (five rating categories) are projected
+into the quiz's S/C/R/A space and compared with every persona's S/C/R/A
+vector by cosine similarity, all in one matrix product. The resulting
+ranking table is cached until the ratings change; since ratings are only
+ever added, the total rating count identifies a ratings snapshot.
+"""
+from typing import Mapping
+
+import numpy as np
+
+from app.services.aggregates import COUNT_KEY, all_averages
+from app.services.catalog import CATALOG, RATING_CATEGORIES
+from app.services.scoring import DIMENSIONS
+
+# Persona key -> S/C/R/A weights.
+PERSONA_VECTORS: dict[str, tuple[float, ...]] = {
+    "S": (1.0, 0.0, 0.0, 0.0),
+    "C": (0.0, 1.0, 0.0, 0.0),
+    "R": (0.0, 0.0, 1.0, 0.0),
+    "A": (0.0, 0.0, 0.0, 1.0),
+    "SR": (1.0, 0.0, 1.0, 0.0),
+}
+
+# How much each rating category (rows, RATING_CATEGORIES order) speaks to each
+# persona dimension (columns, DIMENSIONS order).
+CATEGORY_TO_DIMENSION = np.array([
+    #  S     C     R     A
+    [0.0, 1.0, 0.0, 0.0],   # comfort
+    [-0.5, 0.0, 1.0, 0.0],  # quietness
+    [0.0, 0.0, 0.0, 1.0],   # accessibility
+    [0.5, 0.0, 0.0, 0.0],   # vibe_check
+    [0.5, 0.0, 0.0, 0.0],   # danger
+])
+
+assert CATEGORY_TO_DIMENSION.shape == (len(RATING_CATEGORIES), len(DIMENSIONS))
+
+_PERSONA_KEYS = tuple(PERSONA_VECTORS)
+_PERSONAS = np.array([PERSONA_VECTORS[k] for k in _PERSONA_KEYS])
+_PERSONAS /= np.linalg.norm(_PERSONAS, axis=1, keepdims=True)
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1.0, norms)
+
+
+def rank_locations(averages: Mapping[str, Mapping[str, float]]) -> dict[str, list[str]]:
+    """Every catalog location id, best first, for each persona key."""
+    ids = CATALOG.ids
+    ratings = np.array([[averages[i][c] for c in RATING_CATEGORIES] for i in ids], dtype=float)
+    # Center 1..5 ratings on 0 so a 3 is neutral and low scores count against.
+    locations = _normalize_rows(((ratings - 3.0) / 2.0) @ CATEGORY_TO_DIMENSION)
+    similarity = _PERSONAS @ locations.T
+    order = np.argsort(-similarity, axis=1, kind="stable")
+    return {key: [ids[j] for j in row] for key, row in zip(_PERSONA_KEYS, order)}
+
+
+class Recommender:
+    """Caches the persona ranking table per ratings snapshot."""
+
+    def __init__(self):
+        self._version: int | None = None
+        self._rankings: dict[str, list[str]] = {}
+
+    def top_spots(self, persona: str, totals: Mapping[str, Mapping[str, int]], k: int = 3) -> list[str]:
+        version = sum(t[COUNT_KEY] for t in totals.values())
+        if version != self._version:
+            self._rankings = rank_locations(all_averages(totals))
+            self._version = version
+        return self._rankings.get(persona, [])[:k]
+
+
+RECOMMENDER = Recommender()
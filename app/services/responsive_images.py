@@ -0,0 +1,37 @@
+"""``srcset`` strings for images encoded by ``build_map_images.py``.
+
+The build writes fingerprinted AVIF/WebP copies of each map image in several
+widths plus a manifest keyed by the original's URL. Images that have not been
+built simply have no entry, and pages fall back to the original PNG.
+"""
+import json
+from pathlib import Path
+
+OUTPUT_DIR = Path(__file__).resolve().parents[2] / "assets" / "responsive"
+OUTPUT_URL = "/responsive"
+MANIFEST_PATH = OUTPUT_DIR / "manifest.json"
+
+# Browsers pick the first <source> whose type they support.
+FORMAT_TYPES = {"avif": "image/avif", "webp": "image/webp"}
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> dict[str, dict]:
+    try:
+        return json.loads(path.read_text())
+    except FileNotFoundError:
+        return {}
+
+
+def srcsets(manifest: dict[str, dict]) -> dict[str, dict[str, str]]:
+    """``{format: {original_url: "url 480w, url 960w, ..."}}``."""
+    return {
+        ext: {
+            src: ", ".join(f"{url} {width}w" for width, url in entry[ext])
+            for src, entry in manifest.items()
+            if ext in entry
+        }
+        for ext in FORMAT_TYPES
+    }
+
+
+SRCSETS = srcsets(load_manifest())
@@ -0,0 +1,77 @@
+"""Precomputed quiz scoring.
+
+Every possible answer sequence (4 choices ** 6 questions = 4096) is scored
+once at import time, so resolving a finished quiz to a personality is a
+single dict lookup. Run ``python -m app.services.scoring`` to print the
+persona distribution over all combinations and a lookup benchmark.
+"""
+import itertools
+from collections import Counter
+from typing import Sequence
+
+from app.services.quiz_content import QUESTIONS, Question
+
+DIMENSIONS: tuple[str, ...] = ("S", "C", "R", "A")
+
+ScoreVector = tuple[int, ...]
+
+
+def personality_for_scores(scores: ScoreVector) -> str:
+    """Dominant dimension, or ``"SR"`` when S and R tie for the top score."""
+    dominant = max(range(len(DIMENSIONS)), key=scores.__getitem__)
+    second_score = 0
+    second = -1
+    for i, score in enumerate(scores):
+        if score > second_score and i != dominant:
+            second_score = score
+            second = i
+    if scores[dominant] > 0 and scores[dominant] == second_score:
+        if {DIMENSIONS[dominant], DIMENSIONS[second]} == {"S", "R"}:
+            return "SR"
+    return DIMENSIONS[dominant]
+
+
+def build_table(questions: list[Question]) -> dict[tuple[str, ...], tuple[str, ScoreVector]]:
+    """Map every answer tuple to its personality key and score vector."""
+    per_question = [
+        [
+            (key, tuple(choice["points"].get(d, 0) for d in DIMENSIONS))
+            for key, choice in question["choices"].items()
+        ]
+        for question in questions
+    ]
+    table = {}
+    for combo in itertools.product(*per_question):
+        answers = tuple(key for key, _ in combo)
+        scores = tuple(map(sum, zip(*(points for _, points in combo))))
+        table[answers] = (personality_for_scores(scores), scores)
+    return table
+
+
+TABLE = build_table(QUESTIONS)
+
+
+def score_answers(answers: Sequence[str]) -> tuple[str, dict[str, int]] | None:
+    """Personality key and scores for a complete answer sequence."""
+    entry = TABLE.get(tuple(answers))
+    if entry is None:
+        return None
+    key, scores = entry
+    return key, dict(zip(DIMENSIONS, scores))
+
+
+def persona_distribution() -> Counter[str]:
+    """How many answer combinations lead to each personality."""
+    return Counter(key for key, _ in TABLE.values())
+
+
+if __name__ == "__main__":
+    import timeit
+
+    total = len(TABLE)
+    for key, count in persona_distribution().most_common():
+        print(f"{key:>3}: {count:5d} ({count / total:6.2%})")
+    answers = next(iter(TABLE))
+    runs = 200_000
+    seconds = timeit.timeit(lambda: score_answers(answers), number=runs)
+    print(f"{total} combinations, {seconds / runs * 1e9:.0f} ns per lookup")
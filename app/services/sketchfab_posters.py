@@ -0,0 +1,22 @@
+"""Local poster images for Sketchfab models, built by ``build_sketchfab_posters.py``.
+
+The detail page shows a model's poster until the visitor taps it, and only
+then loads the Sketchfab viewer. Models without a poster get a plain
+placeholder instead.
+"""
+from pathlib import Path
+
+POSTERS_DIR = Path(__file__).resolve().parents[2] / "assets" / "sketchfab"
+POSTERS_URL = "/sketchfab"
+POSTER_WIDTH = 960
+
+
+def poster_path(model_id: str) -> Path:
+    return POSTERS_DIR / f"{model_id}.webp"
+
+
+def poster_url(model_id: str) -> str | None:
+    """URL of the model's poster, or ``None`` if it has not been built."""
+    if not poster_path(model_id).exists():
+        return None
+    return f"{POSTERS_URL}/{model_id}.webp"
@@ -0,0 +1,13 @@
+"""Where ``build_icon_sprites.py`` writes the map icon atlas.
+
+Each icon in ``assets/map images/icon`` becomes a ``.map-icon-<name>`` CSS
+class (e.g. ``map-icon-far``, ``map-icon-icon-up``) on top of the shared
+``.map-icon`` background.
+"""
+from pathlib import Path
+
+SPRITES_DIR = Path(__file__).resolve().parents[2] / "assets" / "sprites"
+SPRITES_URL = "/sprites"
+CSS_PATH = SPRITES_DIR / "map-icons.css"
+CSS_URL = f"{SPRITES_URL}/map-icons.css"
+METADATA_PATH = SPRITES_DIR / "map-icons.json"
@@ -0,0 +1,65 @@
+"""Append-only XP ledger.
+
+Every XP award is recorded as ``(source, amount, key, at)`` and never
+rewritten. ``key`` is an idempotency key naming the thing being rewarded
+(``"check-in:<location_id>"``, ``"achievement:<id>"``, ...), so an event
+replayed after a websocket reconnect cannot award the same XP twice. A
+user's XP, level and titles are all derived from the ledger's running
+total and can be rebuilt with ``replay``.
+"""
+import time
+from typing import Iterable, NamedTuple
+
+XP_PER_LEVEL = 500
+
+# (minimum level, title), highest first.
+LEVEL_TITLES: tuple[tuple[int, str], ...] = (
+    (20, "NAP DEITY"),
+    (15, "SLEEP LEGEND"),
+    (10, "DREAM MASTER"),
+    (7, "REST WARRIOR"),
+    (5, "DOZE EXPERT"),
+    (3, "SNOOZE SCOUT"),
+    (1, "SLEEPY NEWBIE"),
+)
+STARTING_TITLE = "Sleepy Newbie"
+
+
+class LedgerEntry(NamedTuple):
+    source: str
+    amount: int
+    key: str
+    at: float
+
+
+def entry(source: str, amount: int, key: str) -> LedgerEntry:
+    return LedgerEntry(source, amount, key, time.time())
+
+
+def level_for(xp: int) -> int:
+    return xp // XP_PER_LEVEL + 1
+
+
+def title_for(level: int) -> str:
+    for min_level, title in LEVEL_TITLES:
+        if level >= min_level:
+            return title
+    return LEVEL_TITLES[-1][1]
+
+
+def titles_for(level: int) -> list[str]:
+    """Every title unlocked by reaching ``level``, oldest first."""
+    earned = [title for min_level, title in reversed(LEVEL_TITLES) if 1 < min_level <= level]
+    return [STARTING_TITLE, *earned]
+
+
+def replay(entries: Iterable[LedgerEntry]) -> tuple[int, set[str]]:
+    """Running XP total and seen keys; later entries reusing a key are ignored."""
+    total = 0
+    keys: set[str] = set()
+    for source, amount, key, at in entries:
+        if key in keys:
+            continue
+        keys.add(key)
+        total += amount
+    return total, keys
@@ -0,0 +1,46 @@
+"""Memory budget for session state in Redis.
+
+Idle sessions expire after ``SESSION_TTL`` (``redis_token_expiration`` in
+rxconfig), but a burst of new sessions inside one TTL window can still grow
+without bound. With ``POLYUNAP_REDIS_MAXMEMORY`` set, the
+``session_memory_budget`` lifespan task caps Redis at that size with the
+``volatile-lru`` policy. Every state key Reflex writes carries the TTL, so
+Redis evicts the least recently used sessions first once the cap is reached.
+
+Nothing is lost by evicting: progress is queued to ``PROFILES`` as it
+happens. When an evicted client sends its next event, Reflex finds a fresh
+state and asks the page to reload, which re-runs the pages'
+``UserState.load_profile``.
+
+Managed Redis services often reject ``CONFIG SET``; there a warning is logged
+and the same two settings must be made on the server. The default disk state
+manager (no ``REDIS_URL``, development) only expires sessions by TTL.
+"""
+import contextlib
+import os
+from typing import AsyncIterator
+
+from redis.exceptions import ResponseError
+from reflex.utils import console, prerequisites
+
+# Redis maxmemory value, e.g. "512mb"; empty leaves the server's setting alone
+MAX_MEMORY = os.environ.get("POLYUNAP_REDIS_MAXMEMORY", "")
+EVICTION_POLICY = "volatile-lru"
+
+
+@contextlib.asynccontextmanager
+async def session_memory_budget() -> AsyncIterator[None]:
+    """Lifespan task applying ``MAX_MEMORY`` to the state manager's Redis."""
+    redis = prerequisites.get_redis() if MAX_MEMORY else None
+    if redis is not None:
+        try:
+            await redis.config_set("maxmemory", MAX_MEMORY)
+            await redis.config_set("maxmemory-policy", EVICTION_POLICY)
+        except ResponseError as e:
+            console.warn(
+                f"Could not set Redis maxmemory={MAX_MEMORY} with {EVICTION_POLICY} ({e}); "
+                "configure both on the Redis server to bound session memory."
+            )
+        finally:
+            await redis.aclose()
+    yield
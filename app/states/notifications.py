@@ -0,0 +1,50 @@
+"""Per-event toast batching.
+
+Handlers that can raise several toasts (level-ups, achievements, a summary)
+collect them in a ``Notifications`` and return ``flush()`` once at the end,
+so the whole burst reaches the browser as one update instead of one frame
+per ``yield``. Toasts sharing a position get staggered durations so they
+leave the stack one at a time rather than all at once.
+"""
+from dataclasses import dataclass
+from typing import Any, Literal
+
+import reflex as rx
+
+STAGGER_MS = 600
+
+ToastLevel = Literal["success", "info", "warning", "error"]
+
+
+@dataclass(slots=True)
+class _Toast:
+    level: ToastLevel
+    message: Any
+    duration: int
+    position: str
+
+
+class Notifications:
+    """Toasts raised while handling a single event."""
+
+    __slots__ = ("_toasts",)
+
+    def __init__(self):
+        self._toasts: list[_Toast] = []
+
+    def __len__(self) -> int:
+        return len(self._toasts)
+
+    def add(self, level: ToastLevel, message: Any, *, duration: int = 4000, position: str = "bottom-right") -> None:
+        self._toasts.append(_Toast(level, message, duration, position))
+
+    def flush(self) -> list:
+        """Toast events for everything collected, in order; empties the batch."""
+        events = []
+        seen: dict[str, int] = {}
+        for toast in self._toasts:
+            i = seen[toast.position] = seen.get(toast.position, -1) + 1
+            show = getattr(rx.toast, toast.level)
+            events.append(show(toast.message, duration=toast.duration + i * STAGGER_MS, position=toast.position))
+        self._toasts.clear()
+        return events
@@ -1,372 +1,105 @@
 import reflex as rx
-from typing import TypedDict, Literal, cast
+import uuid
+from app import routes
 from app.states.user_state import UserState
-from app.states.location_state import LocationState
-import operator
+from app.services.catalog import CATALOG
+from app.services.quiz_stats import QUIZ_STATS
+from app.services.ratings_store import RATINGS_STORE
+from app.services.recommender import RECOMMENDER
+from app.states.notifications import Notifications
+from app.services.quiz_content import QUESTIONS, Question
+from app.services.scoring import score_answers
 
-# --- TYPED DICTS (No Changes Needed Here) ---
+# Questions ship once as a compile-time literal; the quiz itself runs client-side.
+QUIZ_QUESTIONS: rx.Var[list[Question]] = rx.Var.create(QUESTIONS).to(list[Question])
 
-class Choice(TypedDict):
-    title: str
-    emoji: str
-    points: dict[str, int]
 
-
-class Question(TypedDict):
-    id: str
-    part: str
-    text: str
-    choices: dict[str, Choice]
-    layout: str | None
-
-
-class Personality(TypedDict):
-    title: str
-    description: str
-    icon: str
-    spots: list[str]
-
-
-class QuizState(rx.State):
-    current_page: Literal[
-        "home", "quiz", "results", "locations", "location_detail", "profile", "achievements", "visited_locations"
-    ] = "home"
-    mobile_menu_open: bool = False
-    current_question_index: int = 0
+class QuizState(UserState):
+    # Filled in one go by submit_quiz; answers are collected client-side.
     answers: list[str] = []
     # Initialize scores with the four new dimensions
     scores: dict[str, int] = {"S": 0, "C": 0, "R": 0, "A": 0}
     quiz_finished: bool = False
-    # The list now contains only 6 questions, all with 4 choices, mixing old and new.
-    questions: list[Question] = [
-        {
-            "id": "q1",
-            "part": "The Nap Environment",
-            "text": "What level of noise is perfect for your nap?",
-            "layout": "grid",
-            "choices": {
-                "A": {
-                    "title": "Silent as a tomb (Noise is the enemy)",
-                    "emoji": "🤫",
-                    "points": {"R": 2},
-                },
-                "B": {
-                    "title": "A low, constant hum (Background chatter is calming)",
-                    "emoji": "☕",
-                    "points": {"S": 2},
-                },
-                "C": {
-                    "title": "Anything goes (I can tune out a marching band)",
-                    "emoji": "🎧",
-                    "points": {"A": 2},
-                },
-                "D": {
-                    "title": "Quiet, but I prefer natural white noise (Rain, fan)",
-                    "emoji": "🍃",
-                    "points": {"C": 1, "R": 1},
-                },
-            },
-        },
-        {
-            "id": "q2",
-            "part": "The Nap Environment",
-            "text": "How do you feel about napping in public view?",
-            "layout": "grid",
-            "choices": {
-                "A": {
-                    "title": "Anxiety-inducing. I need total privacy.",
-                    "emoji": "🥷",
-                    "points": {"C": 2},
-                },
-                "B": {
-                    "title": "Slightly thrilling. The risk is part of the fun.",
-                    "emoji": "😎",
-                    "points": {"S": 2},
-                },
-                "C": {
-                    "title": "It's fine, as long as I'm in a designated spot.",
-                    "emoji": "📜",
-                    "points": {"R": 2},
-                },
-                "D": {
-                    "title": "Don't care. I'll nap right in the middle of a crowd.",
-                    "emoji": "🏙️",
-                    "points": {"A": 2},
-                },
-            },
-        },
-        {
-            "id": "q3",
-            "part": "The Nap Surface",
-            "text": "Your ideal nap surface is...",
-            "layout": "grid",
-            "choices": {
-                "A": {
-                    "title": "A plush cloud I can sink into (Ultimate softness)",
-                    "emoji": "☁️",
-                    "points": {"C": 2},
-                },
-                "B": {
-                    "title": "Firm and supportive (Good for posture, not too squishy)",
-                    "emoji": "🪵",
-                    "points": {"R": 1, "A": 1},
-                },
-                "C": {
-                    "title": "Whatever's closest (Back of a chair, desk, floor, etc.)",
-                    "emoji": "🪨",
-                    "points": {"A": 2},
-                },
-                "D": {
-                    "title": "A high vantage point (I like to survey my kingdom)",
-                    "emoji": "🏰",
-                    "points": {"S": 2},
-                },
-            },
-        },
-        {
-            "id": "q4",
-            "part": "The Nap Surface",
-            "text": "How much 'gear' do you bring to a nap?",
-            "choices": {
-                "A": {
-                    "title": "Everything: Mask, pillow, special blanket, earplugs.",
-                    "emoji": "🎒",
-                    "points": {"C": 1, "R": 2},
-                },
-                "B": {
-                    "title": "Maybe a hoodie/bag for a makeshift pillow.",
-                    "emoji": "🧣",
-                    "points": {"S": 2},
-                },
-                "C": {
-                    "title": "Nothing. I use what's available.",
-                    "emoji": "🤷",
-                    "points": {"A": 2},
-                },
-                "D": {
-                    "title": "Just headphones (Music is my blanket)",
-                    "emoji": "🎧",
-                    "points": {"C": 1, "S": 1},
-                },
-            },
-        },
-        {
-            "id": "q5",
-            "part": "The Nap Schedule",
-            "text": "A good nap happens when...",
-            "choices": {
-                "A": {
-                    "title": "It's exactly 2:00 PM (Precision timing is key).",
-                    "emoji": "⏰",
-                    "points": {"R": 2},
-                },
-                "B": {
-                    "title": "I'm suddenly tired and have an unexpected opportunity.",
-                    "emoji": "⚡",
-                    "points": {"S": 2, "A": 1},
-                },
-                "C": {
-                    "title": "I've carved out a comfortable block of at least 60-90 minutes.",
-                    "emoji": "🛌",
-                    "points": {"C": 2},
-                },
-                "D": {
-                    "title": "Whenever I blink for too long (Accidental nap)",
-                    "emoji": "😑",
-                    "points": {"A": 2},
-                },
-            },
-        },
-        {
-            "id": "q6",
-            "part": "The Nap Schedule",
-            "text": "If your favorite spot is taken, you...",
-            "layout": "grid",
-            "choices": {
-                "A": {
-                    "title": "Get mad and refuse to nap until tomorrow (Only the best will do).",
-                    "emoji": "😠",
-                    "points": {"R": 2},
-                },
-                "B": {
-                    "title": "Explore until I find a new, novel, or fun place to try.",
-                    "emoji": "🗺️",
-                    "points": {"A": 2, "S": 1},
-                },
-                "C": {
-                    "title": "Find the *next* most comfortable place immediately.",
-                    "emoji": "🛋️",
-                    "points": {"C": 2},
-                },
-                "D": {
-                    "title": "Ask if they want to share (Nap party)",
-                    "emoji": "👯",
-                    "points": {"S": 2},
-                },
-            },
-        },
-    ]
-    answer_stats: dict[str, dict[str, int]] = {
-        "q1": {"A": 25, "B": 25, "C": 25, "D": 25},
-        "q2": {"A": 25, "B": 25, "C": 25, "D": 25},
-        "q3": {"A": 25, "B": 25, "C": 25, "D": 25},
-        "q4": {"A": 25, "B": 25, "C": 25, "D": 25},
-        "q5": {"A": 25, "B": 25, "C": 25, "D": 25},
-        "q6": {"A": 25, "B": 25, "C": 25, "D": 25},
-    }
-    personalities: dict[str, Personality] = {
-        "S": {
-            "title": "The Thrill Napper",
-            "description": "You thrive on the buzz of activity. A low hum of noise, people moving, and the slight risk of being noticed actually helps you drift off. **Your nap is a covert mission.**",
-            "icon": "ghost",
-            "spots": ["the-spynap-alley", "the-stairwell-stealth"],
-        },
-        "C": {
-            "title": "The Comfort Connoisseur",
-            "description": "Your non-negotiable is comfort. You need plush surfaces, darkness, and a controlled temperature. You seek an immersive, private cocoon for your deepest rest.",
-            "icon": "couch",
-            "spots": ["cloud-nine-credit", "the-modular-dream", "the-curtaincall-nap"],
-        },
-        "R": {
-            "title": "The Precision Planner",
-            "description": "Napping is a dedicated, controlled ritual. You need a designated, quiet space with minimal interruption to maximize efficiency. **Order equals rest.**",
-            "icon": "alarm-clock-check",
-            "spots": ["the-bobafueled-snooze", "the-public-isolation"],
-        },
-        "A": {
-            "title": "The Spontaneous Drifter",
-            "description": "You are a master of napping anywhere, anytime. Conditions don't matter; convenience and opportunity do. The world is your bed.",
-            "icon": "earth",
-            "spots": ["the-urban-zen", "the-shade-throne", "the-stonecold-zen"],
-        },
-        "SR": {
-            "title": "The Stealth Scholar",
-            "description": "A rare blend of routine and risk. You want a quiet, controlled setting but crave the mild stimulation of a public, studious environment.",
-            "icon": "book-user",
-            "spots": ["the-spynap-alley", "the-public-isolation"],
-        },
-        "Default": {
-            "title": "Calculating Persona...",
-            "description": "Your unique sleep profile is being analyzed by our highly-trained digital gnomes.",
-            "icon": "loader",
-            "spots": ["Please wait..."],
-        },
-    }
+    # Issued on every reset so each quiz run has its own XP ledger key,
+    # unique across sessions since the ledger is replayed from PROFILES
+    _quiz_run: str = ""
+    # Campus-wide share of each choice, loaded from QUIZ_STATS when the quiz ends
+    answer_stats: dict[str, dict[str, int]] = {}
+    # Best-matching location ids for the finished quiz, ranked by RECOMMENDER
+    recommended_spots: list[str] = []
 
     @rx.event
-    def set_page(self, page_name: str):
-        self.current_page = cast(
-            Literal[
-                "home", "quiz", "results", "locations", "location_detail", "profile", "achievements", "visited_locations"
-            ],
-            page_name,
+    async def submit_quiz(self, answers: list[str]):
+        """Score a whole quiz answered in the browser, in a single event."""
+        if self.quiz_finished:
+            return
+        scored = score_answers(answers)
+        if scored is None:
+            return [
+                rx.toast.error("Quiz answers were incomplete, please try again.", duration=3000),
+                QuizState.reset_quiz,
+            ]
+
+        self.answers = list(answers)
+        for question, answer in zip(QUESTIONS, answers):
+            QUIZ_STATS.record(question["id"], answer)
+        self.quiz_finished = True
+        self.quiz_completed = True
+        self.scores = scored[1]
+        self.answer_stats = await QUIZ_STATS.percentages(
+            {q["id"]: list(q["choices"]) for q in QUESTIONS}
         )
-        self.mobile_menu_open = False
-        if page_name == "quiz":
-            yield QuizState.reset_quiz
-
-    @rx.event
-    async def handle_answer(self, question_index: int, answer: str):
-        from app.states.user_state import UserState
-        from app.states.location_state import LocationState
+        self.recommended_spots = RECOMMENDER.top_spots(scored[0], await RATINGS_STORE.totals())
+        # Award XP for completing quiz
+        notes = Notifications()
+        if not self._quiz_run:
+            self._quiz_run = uuid.uuid4().hex
+        if self._award_xp("quiz", 250, f"quiz:{self._quiz_run}", notes):
+            notes.add("success", "🎉 Quiz Complete! +250 XP", duration=3000)
         
-        self.answers.append(answer)
-        question = self.questions[question_index]
-        points_to_add = question["choices"][answer]["points"]
-        for dimension, value in points_to_add.items():
-            self.scores[dimension] += value
-        if self.current_question_index < len(self.questions) - 1:
-            self.current_question_index += 1
-        else:
-            self.quiz_finished = True
-            user_state = await self.get_state(UserState)
-            location_state = await self.get_state(LocationState)
-            
-            # Award XP for completing quiz
-            old_level = user_state.level
-            user_state.xp += 250
-            new_level = user_state.level
-            
-            # Check for level up
-            if new_level > old_level:
-                yield user_state.level_up_notification(new_level)
-            
-            yield rx.toast.success(
-                "🎉 Quiz Complete! +250 XP",
-                duration=3000,
-                position="bottom-right"
-            )
-            
-            # Check for nap legend achievement
-            rated_all = len(location_state.ratings) == len(location_state.locations)
-            if rated_all:
-                yield user_state.unlock_achievement("nap-legend")
-            yield QuizState.set_page("results")
+        rated_all = len(self.rating_totals) == len(CATALOG)
+        self._apply_achievements("quiz_finished", {"rated_all": rated_all}, notes)
+        self._save_profile()
+        return [*notes.flush(), rx.redirect(routes.results_path(scored[0]))]
 
     @rx.event
-    def toggle_mobile_menu(self):
-        self.mobile_menu_open = not self.mobile_menu_open
+    async def refresh_recommendations(self):
+        """Re-rank spots against the latest community ratings."""
+        if self.quiz_finished:
+            self.recommended_spots = RECOMMENDER.top_spots(
+                self.personality_type, await RATINGS_STORE.totals()
+            )
 
     @rx.event
     def reset_quiz(self):
-        self.current_question_index = 0
+        self._quiz_run = uuid.uuid4().hex
         self.answers = []
         # Ensure scores are reset for all four dimensions
         self.scores = {"S": 0, "C": 0, "R": 0, "A": 0}
         self.quiz_finished = False
-        self.current_page = "quiz"
+        self.recommended_spots = []
 
-    @rx.var
-    def current_question(self) -> Question | None:
-        if self.current_question_index < len(self.questions):
-            return self.questions[self.current_question_index]
-        return None
-
-    @rx.var
-    def progress_percent(self) -> str:
-        # Progress is calculated based on the reduced 6 questions
-        if not self.questions:
-             return "0%"
-        progress = (self.current_question_index / len(self.questions)) * 100
-        return f"{progress:.0f}%"
+    @rx.event
+    def require_results(self, personality_type: str):
+        """Keep visitors on the result page of their own finished quiz."""
+        if not self.quiz_finished:
+            return rx.redirect(routes.QUIZ)
+        if self.personality_type != personality_type:
+            return rx.redirect(routes.results_path(self.personality_type))
 
     @rx.var
     def personality_type(self) -> str:
         if not self.quiz_finished:
             return "Default"
-            
-        # Get dominant trait
-        dominant_trait = max(self.scores, key=self.scores.get)
-        dominant_score = self.scores[dominant_trait]
-        
-        # Check for a strong tie with another top score
-        second_highest_score = 0
-        second_dominant_trait = ""
-        for trait, score in self.scores.items():
-            if score > second_highest_score and trait != dominant_trait:
-                second_highest_score = score
-                second_dominant_trait = trait
-
-        # Custom Hybrid Logic: Stealth Scholar (SR) if S and R are tied for highest
-        if dominant_score > 0 and dominant_score == second_highest_score:
-            if {dominant_trait, second_dominant_trait} == {"S", "R"}:
-                return "SR"
-            
-        # Return the single dominant trait key
-        return dominant_trait
-
-    @rx.var
-    def personality_details(self) -> Personality:
-        return self.personalities.get(
-            self.personality_type, self.personalities["Default"]
-        )
+        scored = score_answers(self.answers)
+        return scored[0] if scored else "Default"
 
     @rx.var
     def user_answer_stats(self) -> dict[str, int]:
         stats = {}
         if not self.answers:
             return {}
-        for i, question in enumerate(self.questions):
+        for i, question in enumerate(QUESTIONS):
             if i < len(self.answers):
                 user_answer = self.answers[i]
                 question_id = question["id"]
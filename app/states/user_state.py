@@ -1,167 +1,102 @@
 import reflex as rx
 from typing import TypedDict, Literal, cast
 import random
-
-
-class Achievement(TypedDict):
-    id: str
-    title: str
-    description: str
-    icon: str
+from app.services.achievements import (
+    ACHIEVEMENT_BITS,
+    ACHIEVEMENT_XP,
+    ACHIEVEMENTS,
+    Achievement,
+    Facts,
+    Trigger,
+    evaluate,
+)
+from app.services import xp_ledger
+from app.services.profiles import PROFILES, Profile, new_user_token
+from app.services.xp_ledger import LedgerEntry
+from app.states.notifications import Notifications
 
 
 class UserState(rx.State):
-    achievements: dict[str, Achievement] = {
-        "5-star-sleeper": {
-            "id": "5-star-sleeper",
-            "title": "5-Star Sleeper",
-            "description": "Rate a single location with a perfect 5-star score in all categories.",
-            "icon": "star",
-        },
-        "secret-spot-explorer": {
-            "id": "secret-spot-explorer",
-            "title": "Secret Spot Explorer",
-            "description": "Submit ratings for at least 3 different nap spots.",
-            "icon": "map-pin",
-        },
-        "all-area-conqueror": {
-            "id": "all-area-conqueror",
-            "title": "All-Area Conqueror",
-            "description": "Leave your mark by rating all available nap locations.",
-            "icon": "crown",
-        },
-        "nap-legend": {
-            "id": "nap-legend",
-            "title": "Nap Legend",
-            "description": "Complete the personality quiz and rate every single location. A true master of rest.",
-            "icon": "shield-check",
-        },
-        "living-on-the-edge": {
-            "id": "living-on-the-edge",
-            "title": "Living on the Edge",
-            "description": "Rate a location with maximum Danger level. You laugh in the face of peril.",
-            "icon": "skull",
-        },
-        "zen-master": {
-            "id": "zen-master",
-            "title": "Zen Master",
-            "description": "Find a spot with perfect Quietness. Inner peace achieved.",
-            "icon": "flower",
-        },
-        "social-sleeper": {
-            "id": "social-sleeper",
-            "title": "Social Sleeper",
-            "description": "Rate a spot that is loud but has immaculate vibes. Who needs quiet?",
-            "icon": "users",
-        },
-        "night-owl": {
-            "id": "night-owl",
-            "title": "The Night Owl",
-            "description": "Access the app during the witching hours (Late Night).",
-            "icon": "moon",
-        },
-        "secret-boss-defeated": {
-            "id": "secret-boss-defeated",
-            "title": "Secret Boss Defeated",
-            "description": "Discover the hidden nap spot. You found the easter egg.",
-            "icon": "ghost",
-        },
-        "library-legend": {
-            "id": "library-legend",
-            "title": "Library Legend",
-            "description": "Check in at all library locations (G floor study room, bookshelf corridor, and sofa).",
-            "icon": "book-open",
-        },
-        "outdoor-enthusiast": {
-            "id": "outdoor-enthusiast",
-            "title": "Outdoor Enthusiast",
-            "description": "Check in at all outdoor seating areas (wooden, dining, and stone chairs).",
-            "icon": "sun",
-        },
-        "jcit-master": {
-            "id": "jcit-master",
-            "title": "JCIT Master",
-            "description": "Check in at all JCIT locations (Milk Tea Shop, Stairwell, Study Room areas).",
-            "icon": "building",
-        },
-        "comfort-seeker": {
-            "id": "comfort-seeker",
-            "title": "Comfort Seeker",
-            "description": "Check in at all LEGENDARY rarity locations.",
-            "icon": "sofa",
-        },
-        "speed-napper": {
-            "id": "speed-napper",
-            "title": "Speed Napper",
-            "description": "Complete a quiz in under 2 minutes.",
-            "icon": "zap",
-        },
-    }
-    unlocked_achievements: set[str] = set()
+    """A user's persisted progress, shared by the page states below it.
+
+    LocationState and QuizState are substates of UserState, so their handlers
+    read and update progress through ``self`` and an event only loads its own
+    substate chain instead of fetching sibling states. MapState holds no
+    progress and stays outside it, so map events never load UserState.
+    """
+    mobile_menu_open: bool = False
+    achievements: dict[str, Achievement] = ACHIEVEMENTS
+    # Bitmask over ACHIEVEMENT_BITS; exposed to the UI as unlocked_achievements
+    _unlocked: int = 0
+    # Per-rule counters for achievements that take several events to earn
+    achievement_progress: dict[str, int] = {}
     gamertag: str = ""
+    # Running total of the XP ledger; only _award_xp changes it
     xp: int = 0
-    titles: list[str] = ["Sleepy Newbie"]  # Unlocked titles
-    current_title: str = "Sleepy Newbie"  # Currently equipped title
+    # Idempotency keys of every ledger entry; the ledger itself lives in PROFILES
+    _xp_keys: set[str] = set()
+    # Ledger entries awarded since the last _save_profile
+    _xp_unsaved: list[LedgerEntry] = []
+    current_title: str = xp_ledger.STARTING_TITLE  # Currently equipped title
+    # Stable per-browser id that PROFILES is keyed by
+    user_token: str = rx.LocalStorage(name="polyunap_user")
+    _profile_loaded: bool = False
+    # Bitmask over CATALOG.bits; exposed to the UI as LocationState.checked_in_locations
+    _checked_in: int = 0
+    # Running {location_id: {category: sum, "count": n}} totals of this user's ratings
+    rating_totals: dict[str, dict[str, int]] = {}
+    s_rank_total: int = 0
+    # Whether any quiz run has been completed
+    quiz_completed: bool = False
+
+    @rx.event
+    def toggle_mobile_menu(self):
+        self.mobile_menu_open = not self.mobile_menu_open
 
     @rx.var
     def level(self) -> int:
-        return (self.xp // 500) + 1
+        return xp_ledger.level_for(self.xp)
 
     @rx.var
     def xp_to_next_level(self) -> int:
-        return 500 - (self.xp % 500)
+        return xp_ledger.XP_PER_LEVEL - (self.xp % xp_ledger.XP_PER_LEVEL)
 
     @rx.var
     def xp_progress(self) -> int:
-        return int(((self.xp % 500) / 500) * 100)
+        return int(((self.xp % xp_ledger.XP_PER_LEVEL) / xp_ledger.XP_PER_LEVEL) * 100)
     
     @rx.var
     def level_title(self) -> str:
         """Return title based on current level"""
-        if self.level >= 20:
-            return "NAP DEITY"
-        elif self.level >= 15:
-            return "SLEEP LEGEND"
-        elif self.level >= 10:
-            return "DREAM MASTER"
-        elif self.level >= 7:
-            return "REST WARRIOR"
-        elif self.level >= 5:
-            return "DOZE EXPERT"
-        elif self.level >= 3:
-            return "SNOOZE SCOUT"
-        else:
-            return "SLEEPY NEWBIE"
+        return xp_ledger.title_for(self.level)
 
-    @rx.event
-    async def add_xp(self, amount: int, reason: str = ""):
-        """Add XP and check for level up"""
-        old_level = self.level
+    @rx.var
+    def titles(self) -> list[str]:
+        """Titles unlocked so far."""
+        return xp_ledger.titles_for(self.level)
+
+    def _award_xp(self, source: str, amount: int, key: str, notes: Notifications) -> bool:
+        """Append an XP award to the ledger unless ``key`` was already rewarded.
+
+        Queues a level-up toast if the award crosses into a new level.
+        Returns whether the award was recorded.
+        """
+        if key in self._xp_keys:
+            return False
+        self._xp_keys.add(key)
+        self._xp_unsaved.append(xp_ledger.entry(source, amount, key))
+        old_level = xp_ledger.level_for(self.xp)
         self.xp += amount
-        new_level = self.level
-        
-        # Show XP gain notification
-        if reason:
-            yield rx.toast.info(
-                f"+{amount} XP - {reason}",
-                duration=3000,
-                position="bottom-right"
-            )
-        
-        # Check if leveled up
+        new_level = xp_ledger.level_for(self.xp)
         if new_level > old_level:
-            yield self.level_up_notification(new_level)
-    
-    @rx.event
-    def level_up_notification(self, new_level: int):
-        """Show special level up notification"""
-        title = self.level_title
-        
-        # Unlock new title
-        if title not in self.titles:
-            self.titles.append(title)
-        
-        return rx.toast.success(
+            self._note_level_up(new_level, notes)
+        return True
+
+    def _note_level_up(self, new_level: int, notes: Notifications) -> None:
+        """Queue the level-up toast."""
+        title = xp_ledger.title_for(new_level)
+        notes.add(
+            "success",
             f"🎉 LEVEL UP! 🎉\nYou are now Level {new_level}: {title}\n+50 BONUS XP!",
             duration=5000,
             position="top-center"
@@ -173,8 +108,54 @@ class UserState(rx.State):
 
     @rx.event
     def save_gamertag(self):
+        self._save_profile()
         return rx.toast(f"Gamertag saved: {self.gamertag}", duration=3000)
 
+    @rx.event
+    async def load_profile(self):
+        """Restore this browser's saved progress; runs once per session."""
+        if self._profile_loaded:
+            return
+        self._profile_loaded = True
+        if not self.user_token:
+            self.user_token = new_user_token()
+            return
+        profile = await PROFILES.load(self.user_token)
+        if profile is None:
+            return
+        self._apply_profile(profile)
+
+    def _apply_profile(self, profile: Profile) -> None:
+        self.gamertag = profile.gamertag
+        self.current_title = profile.current_title
+        self._unlocked = profile.unlocked
+        self.achievement_progress = dict(profile.achievement_progress)
+        self.xp, self._xp_keys = xp_ledger.replay(profile.xp_ledger)
+        self._xp_unsaved = []
+        self._checked_in = profile.checked_in
+        self.rating_totals = {loc_id: dict(t) for loc_id, t in profile.rating_totals.items()}
+        self.s_rank_total = profile.s_rank_total
+        self.quiz_completed = profile.quiz_completed
+
+    def _save_profile(self) -> None:
+        """Queue this user's progress for PROFILES."""
+        if not self.user_token:
+            return
+        PROFILES.update(
+            self.user_token,
+            gamertag=self.gamertag,
+            current_title=self.current_title,
+            unlocked=self._unlocked,
+            achievement_progress=dict(self.achievement_progress),
+            checked_in=self._checked_in,
+            rating_totals={loc_id: dict(t) for loc_id, t in self.rating_totals.items()},
+            s_rank_total=self.s_rank_total,
+            quiz_completed=self.quiz_completed,
+        )
+        if self._xp_unsaved:
+            PROFILES.append_xp(self.user_token, self._xp_unsaved)
+            self._xp_unsaved = []
+
     quotes: list[str] = [
         "To sleep, perchance to dream... ay, there's the rub... for in that sleep of death what dreams may come? Or, y'know, just drool on your textbook.",
         "The best bridge between despair and hope is a good night's sleep. Or a really, really good nap in the library.",
@@ -194,30 +175,29 @@ class UserState(rx.State):
         "Reality is a construct, and I'm constructing a nap.",
     ]
 
-    @rx.event
-    async def unlock_achievement(self, achievement_id: str):
-        if achievement_id not in self.unlocked_achievements:
-            self.unlocked_achievements.add(achievement_id)
-            achievement = self.achievements[achievement_id]
-            
-            # Give XP for achievement
-            old_level = self.level
-            self.xp += 200
-            new_level = self.level
-            
-            # Check for level up
-            if new_level > old_level:
-                yield self.level_up_notification(new_level)
-            
-            yield rx.toast.warning(
-                rx.el.div(
-                    rx.icon(achievement["icon"], class_name="mr-2"),
-                    f"🏆 Achievement Unlocked: {achievement['title']} (+200 XP)",
-                    class_name="flex items-center",
-                ),
-                duration=5000,
-                position="top-center"
-            )
+    def _grant(self, achievement_id: str, notes: Notifications, xp: int = ACHIEVEMENT_XP) -> None:
+        """Unlock an achievement, award its XP and queue its toast."""
+        bit = ACHIEVEMENT_BITS.bit(achievement_id)
+        if self._unlocked & bit:
+            return
+        self._unlocked |= bit
+        achievement = self.achievements[achievement_id]
+        self._award_xp("achievement", xp, f"achievement:{achievement_id}", notes)
+        notes.add(
+            "warning",
+            rx.el.div(
+                rx.icon(achievement["icon"], class_name="mr-2"),
+                f"🏆 Achievement Unlocked: {achievement['title']} (+{xp} XP)",
+                class_name="flex items-center",
+            ),
+            duration=5000,
+            position="top-center"
+        )
+
+    def _apply_achievements(self, trigger: Trigger, facts: Facts, notes: Notifications) -> None:
+        """Run the achievement rules for ``trigger`` and grant whatever they earn."""
+        for rule in evaluate(trigger, facts, self._unlocked, self.achievement_progress):
+            self._grant(rule.achievement_id, notes, rule.xp)
 
     @rx.var
     def random_quote(self) -> str:
@@ -227,20 +207,24 @@ class UserState(rx.State):
     def total_achievements_count(self) -> int:
         return len(self.achievements)
 
+    @rx.var
+    def unlocked_achievements(self) -> list[str]:
+        return ACHIEVEMENT_BITS.ids(self._unlocked)
+
     @rx.var
     def unlocked_achievements_count(self) -> int:
-        return len(self.unlocked_achievements)
+        return self._unlocked.bit_count()
 
     @rx.var
     def completion_percentage(self) -> int:
         if not self.achievements:
             return 0
-        return int((len(self.unlocked_achievements) / len(self.achievements)) * 100)
+        return int((self._unlocked.bit_count() / len(self.achievements)) * 100)
 
     @rx.var
     def remaining_achievements_count(self) -> int:
-        return len(self.achievements) - len(self.unlocked_achievements)
+        return len(self.achievements) - self._unlocked.bit_count()
 
     @rx.var
     def unlocked_achievements_list(self) -> list[Achievement]:
-        return [self.achievements[id] for id in self.unlocked_achievements]
\ No newline at end of file
+        return [self.achievements[id] for id in ACHIEVEMENT_BITS.ids(self._unlocked)]
\ No newline at end of file
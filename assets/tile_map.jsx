@@ -0,0 +1,250 @@
+// Pan/zoom map that only loads the tiles of a pyramid that are on screen.
+// `pyramid` is a build_map_tiles.py manifest entry; children are overlays
+// positioned in percent of the map and move with it. Without a pyramid the
+// children are rendered in a plain relative box.
+import { useEffect, useRef, useState } from "react";
+
+const MAX_SCALE = 8;
+const DRAG_THRESHOLD = 4;
+const HOME = { s: 1, x: 0, y: 0 };
+
+function levelSize(pyramid, z) {
+  const factor = 2 ** (pyramid.max_zoom - z);
+  return [Math.ceil(pyramid.width / factor), Math.ceil(pyramid.height / factor)];
+}
+
+// Lowest level with at least one tile pixel per device pixel.
+function levelFor(pyramid, displayWidth) {
+  for (let z = 0; z < pyramid.max_zoom; z++) {
+    if (levelSize(pyramid, z)[0] >= displayWidth) return z;
+  }
+  return pyramid.max_zoom;
+}
+
+function tilesIn(pyramid, z, u0, v0, u1, v1) {
+  const [w, h] = levelSize(pyramid, z);
+  const ts = pyramid.tile_size;
+  const tiles = [];
+  const x1 = Math.min(Math.ceil((u1 * w) / ts), Math.ceil(w / ts));
+  const y1 = Math.min(Math.ceil((v1 * h) / ts), Math.ceil(h / ts));
+  for (let x = Math.max(0, Math.floor((u0 * w) / ts)); x < x1; x++) {
+    for (let y = Math.max(0, Math.floor((v0 * h) / ts)); y < y1; y++) {
+      tiles.push({
+        key: `${z}/${x}/${y}`,
+        src: pyramid.url.replace("{z}", z).replace("{x}", x).replace("{y}", y),
+        left: ((x * ts) / w) * 100,
+        top: ((y * ts) / h) * 100,
+        width: (Math.min(ts, w - x * ts) / w) * 100,
+        height: (Math.min(ts, h - y * ts) / h) * 100,
+      });
+    }
+  }
+  return tiles;
+}
+
+function clamp(view, size) {
+  const s = Math.min(Math.max(view.s, 1), MAX_SCALE);
+  return {
+    s,
+    x: Math.min(0, Math.max(size.w - size.w * s, view.x)),
+    y: Math.min(0, Math.max(size.h - size.h * s, view.y)),
+  };
+}
+
+// Scale by `factor` keeping the map point under (px, py) in place.
+function zoomAt(view, factor, px, py, size) {
+  const s = Math.min(Math.max(view.s * factor, 1), MAX_SCALE);
+  const ratio = s / view.s;
+  return clamp({ s, x: px - (px - view.x) * ratio, y: py - (py - view.y) * ratio }, size);
+}
+
+const tileStyle = (tile) => ({
+  position: "absolute",
+  left: `${tile.left}%`,
+  top: `${tile.top}%`,
+  width: `${tile.width}%`,
+  height: `${tile.height}%`,
+  pointerEvents: "none",
+  userSelect: "none",
+});
+
+const controlStyle = {
+  width: "2rem",
+  height: "2rem",
+  background: "rgba(26, 26, 46, 0.85)",
+  border: "2px solid #00ff9f",
+  color: "#00ff9f",
+  fontWeight: "bold",
+  cursor: "pointer",
+};
+
+export function TileMap({ pyramid, className, children }) {
+  const box = useRef(null);
+  const [size, setSize] = useState({ w: 0, h: 0 });
+  const [view, setView] = useState(HOME);
+  const sizeRef = useRef(size);
+  const pointers = useRef(new Map());
+  const gesture = useRef(null);
+  const dragged = useRef(false);
+  sizeRef.current = size;
+
+  useEffect(() => {
+    if (!box.current) return;
+    const observer = new ResizeObserver(([entry]) => {
+      setSize({ w: entry.contentRect.width, h: entry.contentRect.height });
+    });
+    observer.observe(box.current);
+    return () => observer.disconnect();
+  }, [pyramid?.url]);
+
+  useEffect(() => setView(HOME), [pyramid?.url]);
+
+  // React's onWheel is passive, so page scrolling could not be prevented.
+  useEffect(() => {
+    const el = box.current;
+    if (!el) return;
+    const onWheel = (e) => {
+      e.preventDefault();
+      const rect = el.getBoundingClientRect();
+      const factor = Math.exp(-e.deltaY * 0.002);
+      setView((v) => zoomAt(v, factor, e.clientX - rect.left, e.clientY - rect.top, sizeRef.current));
+    };
+    el.addEventListener("wheel", onWheel, { passive: false });
+    return () => el.removeEventListener("wheel", onWheel);
+  }, [pyramid?.url]);
+
+  if (!pyramid) {
+    return (
+      <div className={className} style={{ position: "relative" }}>
+        {children}
+      </div>
+    );
+  }
+
+  const local = (e) => {
+    const rect = box.current.getBoundingClientRect();
+    return { x: e.clientX - rect.left, y: e.clientY - rect.top };
+  };
+
+  const startGesture = () => {
+    const points = [...pointers.current.values()];
+    if (points.length === 1) {
+      gesture.current = { start: points[0], view };
+    } else if (points.length === 2) {
+      const [a, b] = points;
+      gesture.current = {
+        distance: Math.hypot(a.x - b.x, a.y - b.y),
+        mid: { x: (a.x + b.x) / 2, y: (a.y + b.y) / 2 },
+        view,
+      };
+    } else {
+      gesture.current = null;
+    }
+  };
+
+  const onPointerDown = (e) => {
+    if (pointers.current.size === 0) dragged.current = false;
+    pointers.current.set(e.pointerId, local(e));
+    startGesture();
+  };
+
+  const onPointerMove = (e) => {
+    if (!pointers.current.has(e.pointerId) || !gesture.current) return;
+    pointers.current.set(e.pointerId, local(e));
+    const points = [...pointers.current.values()];
+    const g = gesture.current;
+    if (points.length === 1) {
+      const dx = points[0].x - g.start.x;
+      const dy = points[0].y - g.start.y;
+      if (!dragged.current && Math.hypot(dx, dy) < DRAG_THRESHOLD) return;
+      if (!dragged.current) {
+        dragged.current = true;
+        box.current.setPointerCapture(e.pointerId);
+      }
+      setView(clamp({ s: g.view.s, x: g.view.x + dx, y: g.view.y + dy }, size));
+    } else if (points.length === 2) {
+      const [a, b] = points;
+      dragged.current = true;
+      const factor = Math.hypot(a.x - b.x, a.y - b.y) / g.distance;
+      setView(zoomAt(g.view, factor, g.mid.x, g.mid.y, size));
+    }
+  };
+
+  const onPointerUp = (e) => {
+    pointers.current.delete(e.pointerId);
+    startGesture();
+  };
+
+  // A pan or pinch must not also click the marker it ended on.
+  const onClickCapture = (e) => {
+    if (dragged.current) {
+      e.stopPropagation();
+      e.preventDefault();
+      dragged.current = false;
+    }
+  };
+
+  const zoomCenter = (factor) => setView((v) => zoomAt(v, factor, size.w / 2, size.h / 2, size));
+
+  const dpr = typeof window === "undefined" ? 1 : window.devicePixelRatio || 1;
+  const z = levelFor(pyramid, size.w * view.s * dpr);
+  const scaled = size.w * view.s;
+  const u0 = scaled ? -view.x / scaled : 0;
+  const v0 = size.h ? -view.y / (size.h * view.s) : 0;
+  // Level 0 stays underneath so nothing is blank while finer tiles load.
+  const tiles = [
+    ...(z > 0 ? tilesIn(pyramid, 0, 0, 0, 1, 1) : []),
+    ...tilesIn(pyramid, z, u0, v0, u0 + 1 / view.s, v0 + 1 / view.s),
+  ];
+
+  return (
+    <div
+      ref={box}
+      className={className}
+      style={{
+        position: "relative",
+        overflow: "hidden",
+        touchAction: "none",
+        aspectRatio: `${pyramid.width} / ${pyramid.height}`,
+      }}
+      onPointerDown={onPointerDown}
+      onPointerMove={onPointerMove}
+      onPointerUp={onPointerUp}
+      onPointerCancel={onPointerUp}
+      onClickCapture={onClickCapture}
+      onDoubleClick={(e) => {
+        const p = local(e);
+        setView((v) => zoomAt(v, 2, p.x, p.y, size));
+      }}
+    >
+      <div
+        style={{
+          position: "absolute",
+          inset: 0,
+          transformOrigin: "0 0",
+          transform: `translate(${view.x}px, ${view.y}px) scale(${view.s})`,
+        }}
+      >
+        {tiles.map((tile) => (
+          <img key={tile.key} src={tile.src} alt="" draggable={false} decoding="async" style={tileStyle(tile)} />
+        ))}
+        {children}
+      </div>
+      <div
+        style={{ position: "absolute", right: 8, bottom: 8, display: "flex", flexDirection: "column", gap: 4, zIndex: 200 }}
+        onPointerDown={(e) => e.stopPropagation()}
+        onDoubleClick={(e) => e.stopPropagation()}
+      >
+        <button type="button" aria-label="Zoom in" style={controlStyle} onClick={() => zoomCenter(2)}>
+          +
+        </button>
+        <button type="button" aria-label="Zoom out" style={controlStyle} onClick={() => zoomCenter(0.5)}>
+          −
+        </button>
+        <button type="button" aria-label="Reset zoom" style={controlStyle} onClick={() => setView(HOME)}>
+          ⟲
+        </button>
+      </div>
+    </div>
+  );
+}
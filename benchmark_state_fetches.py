@@ -0,0 +1,300 @@
+"""Count the substates the Redis state manager loads for the hot user flows.
+
+Usage:
+    python benchmark_state_fetches.py [--runs N] [--baseline REV]
+
+With Redis, every event loads its handler's substate, that substate's parents
+and the substates whose computed vars depend on it; each ``get_state`` to a
+state outside that set is another round trip, and every touched substate is
+written back. Each flow below (check in, rate a spot, finish the quiz, pick a
+spot on the map) is sent through a real ``StateManagerRedis`` the way the
+app's event loop does, following any server events the handlers chain, and
+the read round trips (pipelines), the substate GETs batched into them and
+the SETs it issues are counted.
+
+``REDIS_URL`` selects the Redis server; without it an in-process
+``fakeredis`` is used (``pip install fakeredis``). ``--baseline REV`` runs the
+same flows in a temporary git worktree of ``REV`` (e.g. the baseline commit)
+and prints both sets of numbers. The flows only call handlers that exist in
+the checked-out code, so older revisions use their own equivalents (e.g. one
+``handle_answer`` event per question instead of one ``submit_quiz``).
+"""
+import argparse
+import asyncio
+import inspect
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from urllib.parse import urlencode
+
+os.environ.setdefault("POLYUNAP_DB_PATH", os.path.join(tempfile.mkdtemp(), "benchmark.db"))
+os.environ.setdefault("POLYUNAP_CHECKIN_SECRET", "benchmark")
+
+FLOWS = ("check-in", "submit rating", "finish quiz", "map marker")
+
+
+class CountingRedis:
+    """Counts the substate GETs and SETs a state manager sends to ``redis``,
+    and the pipelines (one round trip each) the GETs are batched into."""
+
+    def __init__(self, redis):
+        self._redis = redis
+        self.pipelines = 0
+        self.gets = 0
+        self.sets = 0
+
+    def pipeline(self, *args, **kwargs):
+        self.pipelines += 1
+        pipe = self._redis.pipeline(*args, **kwargs)
+        get = pipe.get
+
+        def counted_get(key):
+            self.gets += 1
+            return get(key)
+
+        pipe.get = counted_get
+        return pipe
+
+    async def set(self, *args, **kwargs):
+        self.sets += 1
+        return await self._redis.set(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._redis, name)
+
+
+def _redis_client():
+    if url := os.environ.get("REDIS_URL"):
+        import redis.asyncio
+
+        return redis.asyncio.from_url(url)
+    try:
+        import fakeredis
+    except ImportError:
+        sys.exit("Set REDIS_URL or pip install fakeredis to run the benchmark")
+    return fakeredis.FakeAsyncRedis()
+
+
+class Session:
+    """One client token whose events go through the Redis state manager."""
+
+    def __init__(self, manager, counter: CountingRedis):
+        self._manager = manager
+        self._counter = counter
+        self.token = str(uuid.uuid4())
+        # Totals over emitted events only; setup() and read() are not counted.
+        self.events = 0
+        self.reads = 0
+        self.loads = 0
+        self.writes = 0
+
+    def _router_data(self, query: dict) -> dict:
+        as_path = f"/?{urlencode(query)}" if query else "/"
+        return {"pathname": "/", "asPath": as_path, "query": query, "token": self.token, "headers": {}}
+
+    async def setup(self, state_cls, **values) -> None:
+        """Set vars directly, outside any measured event."""
+        token = f"{self.token}_{state_cls.get_full_name()}"
+        state = await self._manager.get_state(token)
+        substate = state.get_substate(state_cls.get_full_name().split("."))
+        for name, value in values.items():
+            setattr(substate, name, value)
+        await self._manager.set_state(token, state)
+
+    async def read(self, state_cls, name: str):
+        state = await self._manager.get_state(f"{self.token}_{state_cls.get_full_name()}")
+        return getattr(state.get_substate(state_cls.get_full_name().split(".")), name)
+
+    async def emit(self, state_cls, handlers: tuple[str, ...], query: dict | None = None, **payload) -> None:
+        """Send the first of ``handlers`` that ``state_cls`` defines, with the
+        arguments from ``payload`` that it takes, then any server events it chains."""
+        from reflex.event import Event
+
+        name = next(h for h in handlers if h in state_cls.event_handlers)
+        params = inspect.signature(state_cls.event_handlers[name].fn).parameters
+        event = Event(
+            token=self.token,
+            name=f"{state_cls.get_full_name()}.{name}",
+            payload={k: v for k, v in payload.items() if k in params},
+        )
+        pipelines, gets, sets = self._counter.pipelines, self._counter.gets, self._counter.sets
+        await self._process(event, self._router_data(query or {}))
+        self.reads += self._counter.pipelines - pipelines
+        self.loads += self._counter.gets - gets
+        self.writes += self._counter.sets - sets
+
+    async def _process(self, event, router_data: dict) -> None:
+        from reflex.istate.data import RouterData
+
+        self.events += 1
+        state = await self._manager.get_state(event.substate_token)
+        if state.router_data != router_data:
+            state.router_data = router_data
+            state.router = RouterData.from_router_data(router_data)
+        chained = []
+        async for update in state._process(event):
+            # Frontend-only events (toasts, redirects) start with an underscore.
+            chained.extend(e for e in update.events if not e.name.startswith("_"))
+        await self._manager.set_state(event.substate_token, state)
+        for follow_up in chained:
+            await self._process(follow_up, router_data)
+
+
+def _state(module: str, name: str):
+    return getattr(__import__(module, fromlist=[name]), name)
+
+
+async def _check_in(session: Session, location_id: str) -> None:
+    from app.states.location_state import LocationState
+
+    query = {"location_id": location_id}
+    try:
+        from app.services.checkin_tokens import issue_token
+
+        query["t"] = issue_token(location_id)
+    except ImportError:
+        pass
+    await session.emit(
+        LocationState,
+        ("check_in_from_qr", "check_in_location", "load_location"),
+        query=query,
+        location_id=location_id,
+    )
+
+
+async def _rate(session: Session, location_id: str) -> None:
+    from app.states.location_state import LocationState
+
+    await session.setup(LocationState, selected_location_id=location_id)
+    form_key = None
+    if "rating_form_key" in LocationState.computed_vars:
+        form_key = await session.read(LocationState, "rating_form_key")
+    await session.emit(LocationState, ("submit_rating",), form_key=form_key)
+
+
+async def _quiz(session: Session, location_id: str) -> None:
+    from app.states.quiz_state import QuizState
+
+    if "submit_quiz" in QuizState.event_handlers:
+        from app.services.quiz_content import QUESTIONS
+
+        answers = [next(iter(q["choices"])) for q in QUESTIONS]
+        await session.emit(QuizState, ("submit_quiz",), answers=answers)
+        return
+    questions = await session.read(QuizState, "questions")
+    for index, question in enumerate(questions):
+        answer = next(iter(question["choices"]))
+        await session.emit(QuizState, ("handle_answer",), question_index=index, answer=answer)
+
+
+async def _map_marker(session: Session, location_id: str) -> None:
+    map_state = _state("app.components.interactive_map", "MapState")
+    await session.emit(
+        map_state, ("select_location_and_close", "close_floor_view"), location_id=location_id
+    )
+
+
+FLOW_RUNNERS = {
+    "check-in": _check_in,
+    "submit rating": _rate,
+    "finish quiz": _quiz,
+    "map marker": _map_marker,
+}
+
+
+def _location_ids() -> list[str]:
+    try:
+        from app.services.catalog import CATALOG
+    except ImportError:
+        # Before the shared catalog, every LocationState carried the list.
+        location_state = _state("app.states.location_state", "LocationState")
+        return [loc["id"] for loc in location_state.get_fields()["locations"].default_value()]
+    return [location.id for location in CATALOG]
+
+
+async def measure(runs: int) -> dict[str, dict[str, float]]:
+    from reflex.utils.prerequisites import get_and_validate_app
+
+    app = get_and_validate_app().app
+    from reflex.istate.manager.redis import StateManagerRedis
+
+    counter = CountingRedis(_redis_client())
+    manager = StateManagerRedis(state=app._state, redis=counter)
+    app._state_manager = manager
+
+    location_ids = _location_ids()
+    results = {}
+    for flow in FLOWS:
+        reads = gets = sets = events = 0
+        elapsed = 0.0
+        for i in range(runs):
+            session = Session(manager, counter)
+            # Materialize the session so loads below are steady-state, not first-visit.
+            await session.setup(app._state)
+            start = time.perf_counter()
+            await FLOW_RUNNERS[flow](session, location_ids[i % len(location_ids)])
+            elapsed += time.perf_counter() - start
+            reads += session.reads
+            gets += session.loads
+            sets += session.writes
+            events += session.events
+        results[flow] = {
+            "events": events / runs,
+            "reads": reads / runs,
+            "loads": gets / runs,
+            "writes": sets / runs,
+            "ms": elapsed / runs * 1e3,
+        }
+    return results
+
+
+def _run_at(rev: str, runs: int) -> dict[str, dict[str, float]]:
+    """Run this script in a temporary worktree of ``rev`` and return its numbers."""
+    worktree = Path(tempfile.mkdtemp()) / "baseline"
+    subprocess.run(["git", "worktree", "add", "--detach", str(worktree), rev], check=True, capture_output=True)
+    try:
+        shutil.copy(__file__, worktree / "benchmark_state_fetches.py")
+        out = subprocess.run(
+            [sys.executable, "benchmark_state_fetches.py", "--runs", str(runs), "--json"],
+            cwd=worktree, check=True, capture_output=True, text=True,
+        ).stdout
+        return json.loads(out.splitlines()[-1])
+    finally:
+        subprocess.run(["git", "worktree", "remove", "--force", str(worktree)], check=True)
+
+
+def _print(results: dict[str, dict[str, float]], baseline: dict | None, rev: str | None) -> None:
+    columns = ("events", "reads", "loads", "writes")
+    print(f"{'flow':<14}" + "".join(f" {c:>6}" for c in columns) + f" {'mean':>9}", end="")
+    print(f"   vs {rev[:10]}" if baseline else "")
+    for flow, r in results.items():
+        print(f"{flow:<14}" + "".join(f" {r[c]:>6.1f}" for c in columns) + f" {r['ms']:>7.2f}ms", end="")
+        if baseline:
+            print("   " + " ".join(f"{baseline[flow][c]:>5.1f}" for c in columns))
+        else:
+            print()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--baseline", metavar="REV", help="also measure this git revision")
+    parser.add_argument("--json", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    results = asyncio.run(measure(args.runs))
+    if args.json:
+        print(json.dumps(results))
+        return
+    baseline = _run_at(args.baseline, args.runs) if args.baseline else None
+    _print(results, baseline, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
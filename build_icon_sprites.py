@@ -0,0 +1,94 @@
+"""Pack the map marker icons into one sprite atlas with generated CSS.
+
+Usage:
+    python build_icon_sprites.py
+
+Every PNG in ``assets/map images/icon`` is packed left to right into one
+image, ``assets/sprites/map-icons.<hash>.png``, so opening a floor view
+fetches a single file instead of one per icon. ``map-icons.css`` defines a
+``.map-icon-<name>`` class per icon in percentages (size it with a width
+class; the height follows the icon's aspect ratio), and ``map-icons.json``
+records each icon's pixel box in the atlas.
+"""
+import argparse
+import hashlib
+import io
+import json
+import re
+from pathlib import Path
+
+from PIL import Image
+
+from app.services.sprites import CSS_PATH, METADATA_PATH, SPRITES_DIR, SPRITES_URL
+
+ICON_DIR = Path("assets") / "map images" / "icon"
+PADDING = 2  # Keeps neighbours out of the edges when the atlas is scaled.
+
+
+def icon_name(path: Path) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", path.stem.lower()).strip("-")
+
+
+def pack(icons: dict[str, Image.Image]) -> tuple[Image.Image, dict[str, list[int]]]:
+    """One row of icons, top-aligned; returns the atlas and ``[x, y, w, h]`` boxes."""
+    width = sum(icon.width for icon in icons.values()) + PADDING * (len(icons) + 1)
+    height = max(icon.height for icon in icons.values()) + PADDING * 2
+    atlas = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+    boxes = {}
+    x = PADDING
+    for name, icon in icons.items():
+        atlas.paste(icon, (x, PADDING))
+        boxes[name] = [x, PADDING, icon.width, icon.height]
+        x += icon.width + PADDING
+    return atlas, boxes
+
+
+def _percent(offset: int, free: int) -> str:
+    return f"{offset / free:.4%}" if free else "0%"
+
+
+def sprite_css(url: str, size: tuple[int, int], boxes: dict[str, list[int]]) -> str:
+    atlas_w, atlas_h = size
+    rules = [
+        "/* Generated by build_icon_sprites.py; do not edit. */",
+        f".map-icon {{\n  background-image: url(\"{url}\");\n  background-repeat: no-repeat;\n}}",
+    ]
+    for name, (x, y, w, h) in boxes.items():
+        rules.append(
+            f".map-icon-{name} {{\n"
+            f"  aspect-ratio: {w} / {h};\n"
+            f"  background-size: {atlas_w / w:.4%} {atlas_h / h:.4%};\n"
+            f"  background-position: {_percent(x, atlas_w - w)} {_percent(y, atlas_h - h)};\n"
+            f"}}"
+        )
+    return "\n\n".join(rules) + "\n"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.parse_args()
+
+    icons = {}
+    for path in sorted(ICON_DIR.glob("*.png")):
+        with Image.open(path) as image:
+            icons[icon_name(path)] = image.convert("RGBA")
+    atlas, boxes = pack(icons)
+
+    buffer = io.BytesIO()
+    atlas.save(buffer, format="PNG", optimize=True)
+    data = buffer.getvalue()
+    filename = f"map-icons.{hashlib.sha256(data).hexdigest()[:10]}.png"
+
+    SPRITES_DIR.mkdir(parents=True, exist_ok=True)
+    for leftover in SPRITES_DIR.glob("map-icons.*.png"):
+        if leftover.name != filename:
+            leftover.unlink()
+    (SPRITES_DIR / filename).write_bytes(data)
+    url = f"{SPRITES_URL}/{filename}"
+    CSS_PATH.write_text(sprite_css(url, atlas.size, boxes))
+    METADATA_PATH.write_text(json.dumps({"image": url, "size": atlas.size, "icons": boxes}, indent=2))
+    print(f"Packed {len(icons)} icons into {SPRITES_DIR / filename} ({len(data) / 1e3:.0f} KB)")
+
+
+if __name__ == "__main__":
+    main()
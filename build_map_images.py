@@ -0,0 +1,118 @@
+"""Encode the map images as fingerprinted AVIF/WebP files in several widths.
+
+Usage:
+    python build_map_images.py [--jobs N] [--force]
+
+Every PNG under ``assets/map images`` (except the marker icons and the ``Main
+map`` highlight variants) is resized to each of ``WIDTHS`` that is narrower
+than the original, plus the original width, and saved as AVIF and WebP in
+``assets/responsive``. File names carry a
+hash of their bytes so they can be cached forever. ``manifest.json`` maps each
+source's URL to its variants; ``responsive_image`` reads it to emit
+``srcset``. Sources whose bytes and settings are unchanged are skipped.
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import Image
+
+from app.services.responsive_images import MANIFEST_PATH, OUTPUT_DIR, OUTPUT_URL
+
+ASSETS = Path("assets")
+SOURCE_DIR = ASSETS / "map images"
+# Marker icons, and the highlight variants that build_map_overlays.py stores as overlays
+SKIP_DIRS = {"icon", "Main map"}
+WIDTHS = (480, 960, 1600, 2400)
+# Pillow save() options per format, keyed by file extension.
+FORMATS = {
+    "avif": {"quality": 55, "speed": 6},
+    "webp": {"quality": 80, "method": 6},
+}
+SETTINGS_VERSION = 1
+
+
+def source_url(path: Path) -> str:
+    return "/" + path.relative_to(ASSETS).as_posix()
+
+
+def slug(path: Path) -> str:
+    stem = path.relative_to(SOURCE_DIR).with_suffix("").as_posix()
+    return re.sub(r"[^a-z0-9]+", "-", stem.lower()).strip("-")
+
+
+def file_hash(path: Path) -> str:
+    digest = hashlib.sha256(path.read_bytes())
+    digest.update(json.dumps([SETTINGS_VERSION, WIDTHS, FORMATS], sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def encode_image(path: str, name: str) -> dict:
+    """Write every width and format of one source; returns its manifest entry."""
+    with Image.open(path) as original:
+        original.load()
+    width, height = original.size
+    widths = sorted({w for w in WIDTHS if w < width} | {width})
+    entry: dict = {"width": width, "height": height}
+    for ext, options in FORMATS.items():
+        variants = []
+        for w in widths:
+            resized = original if w == width else original.resize(
+                (w, round(height * w / width)), Image.LANCZOS
+            )
+            buffer = io.BytesIO()
+            resized.save(buffer, format=ext.upper(), **options)
+            data = buffer.getvalue()
+            filename = f"{name}-{w}.{hashlib.sha256(data).hexdigest()[:10]}.{ext}"
+            (OUTPUT_DIR / filename).write_bytes(data)
+            variants.append([w, f"{OUTPUT_URL}/{filename}"])
+        entry[ext] = variants
+    return entry
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--force", action="store_true", help="re-encode even if unchanged")
+    args = parser.parse_args()
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    manifest = {} if args.force or not MANIFEST_PATH.exists() else json.loads(MANIFEST_PATH.read_text())
+
+    sources = sorted(
+        p for p in SOURCE_DIR.rglob("*.png")
+        if not SKIP_DIRS & set(p.relative_to(SOURCE_DIR).parts[:-1])
+    )
+    hashes = {source_url(p): file_hash(p) for p in sources}
+    stale = [
+        p for p in sources
+        if manifest.get(source_url(p), {}).get("hash") != hashes[source_url(p)]
+        or not all(
+            (OUTPUT_DIR / Path(url).name).exists()
+            for ext in FORMATS for _, url in manifest[source_url(p)][ext]
+        )
+    ]
+
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        entries = pool.map(encode_image, [str(p) for p in stale], [slug(p) for p in stale])
+        for path, entry in zip(stale, entries):
+            manifest[source_url(path)] = {**entry, "hash": hashes[source_url(path)]}
+
+    manifest = {url: manifest[url] for url in sorted(hashes)}
+    keep = {Path(url).name for entry in manifest.values() for ext in FORMATS for _, url in entry[ext]}
+    for leftover in OUTPUT_DIR.iterdir():
+        if leftover.name not in keep and leftover != MANIFEST_PATH:
+            leftover.unlink()
+
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2))
+    total = sum((OUTPUT_DIR / name).stat().st_size for name in keep)
+    print(f"Encoded {len(stale)}/{len(sources)} images into {OUTPUT_DIR}/ ({total / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Store the highlighted campus map variants as overlays on the base map.
+
+Usage:
+    python build_map_overlays.py
+
+Each PNG in ``assets/map images/Main map`` is diffed against the base campus
+map. The changed pixels, cropped to their bounding box and transparent
+elsewhere, are saved as a lossless WebP in ``assets/overlays`` under a name
+carrying a hash of its bytes. ``manifest.json`` records where each overlay
+sits on the base map (in percent) for ``map_variant``. The variants are small
+and few, so everything is rebuilt on every run.
+"""
+import argparse
+import hashlib
+import io
+import json
+import re
+from functools import reduce
+from pathlib import Path
+
+from PIL import Image, ImageChops
+
+from app.services.map_overlays import BASE_MAP, MANIFEST_PATH, OVERLAYS_DIR, OVERLAYS_URL
+
+ASSETS = Path("assets")
+VARIANT_DIR = ASSETS / "map images" / "Main map"
+
+
+def source_url(path: Path) -> str:
+    return "/" + path.relative_to(ASSETS).as_posix()
+
+
+def label(path: Path) -> str:
+    """The highlighted spot (``"<place>-The <spot>"``) or building name."""
+    return re.split(r"-(?=The )", path.stem, maxsplit=1)[-1]
+
+
+def overlay(base: Image.Image, variant: Image.Image) -> tuple[Image.Image, tuple[int, int, int, int]] | None:
+    """The variant's changed pixels cropped to their bounding box, or ``None``."""
+    diff = ImageChops.difference(base, variant).split()
+    changed = reduce(ImageChops.lighter, diff).point(lambda v: 255 if v else 0)
+    box = changed.getbbox()
+    if box is None:
+        return None
+    layer = variant.copy()
+    layer.putalpha(ImageChops.multiply(variant.getchannel("A"), changed))
+    return layer.crop(box), box
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.parse_args()
+
+    OVERLAYS_DIR.mkdir(parents=True, exist_ok=True)
+    with Image.open(ASSETS / BASE_MAP.lstrip("/")) as image:
+        base = image.convert("RGBA")
+    width, height = base.size
+
+    manifest = {}
+    written = set()
+    saved = 0
+    for path in sorted(VARIANT_DIR.glob("*.png")):
+        with Image.open(path) as image:
+            variant = image.convert("RGBA")
+        if variant.size != base.size:
+            raise SystemExit(f"{path} is {variant.size}, the base map is {base.size}")
+        entry = {"base": BASE_MAP, "label": label(path), "overlay": None}
+        result = overlay(base, variant)
+        if result is not None:
+            layer, (left, top, right, bottom) = result
+            buffer = io.BytesIO()
+            layer.save(buffer, format="WEBP", lossless=True, method=6)
+            data = buffer.getvalue()
+            slug = re.sub(r"[^a-z0-9]+", "-", path.stem.lower()).strip("-")
+            filename = f"{slug}.{hashlib.sha256(data).hexdigest()[:10]}.webp"
+            (OVERLAYS_DIR / filename).write_bytes(data)
+            written.add(filename)
+            entry["overlay"] = {
+                "src": f"{OVERLAYS_URL}/{filename}",
+                "left": f"{left / width:.4%}",
+                "top": f"{top / height:.4%}",
+                "width": f"{(right - left) / width:.4%}",
+                "height": f"{(bottom - top) / height:.4%}",
+            }
+            saved += len(data)
+        manifest[source_url(path)] = entry
+
+    for leftover in OVERLAYS_DIR.glob("*.webp"):
+        if leftover.name not in written:
+            leftover.unlink()
+
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2))
+    originals = sum(p.stat().st_size for p in VARIANT_DIR.glob("*.png"))
+    print(f"{len(manifest)} variants: {originals / 1e6:.1f} MB of PNGs -> {saved / 1e3:.0f} KB of overlays")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Cut the campus and floor maps into zoomable tile pyramids.
+
+Usage:
+    python build_map_tiles.py [--jobs N] [--force]
+
+Each PNG directly in ``assets/map images`` (the maps the interactive map shows)
+is cut into ``TILE_SIZE`` WebP tiles at every zoom level, written to
+``assets/tiles/<name>-<hash>/<z>/<x>_<y>.webp``. The directory name carries a
+hash of the source and settings, so tiles can be cached forever.
+``manifest.json`` maps each source's URL to its pyramid for ``tile_map``.
+Sources whose bytes and settings are unchanged are skipped.
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import Image
+
+from app.services.map_tiles import MANIFEST_PATH, TILE_SIZE, TILES_DIR, TILES_URL, level_size, max_zoom
+
+ASSETS = Path("assets")
+SOURCE_DIR = ASSETS / "map images"
+WEBP_OPTIONS = {"quality": 80, "method": 6}
+SETTINGS_VERSION = 1
+
+
+def source_url(path: Path) -> str:
+    return "/" + path.relative_to(ASSETS).as_posix()
+
+
+def pyramid_dir(path: Path) -> str:
+    digest = hashlib.sha256(path.read_bytes())
+    digest.update(json.dumps([SETTINGS_VERSION, TILE_SIZE, WEBP_OPTIONS], sort_keys=True).encode())
+    name = re.sub(r"[^a-z0-9]+", "-", path.stem.lower()).strip("-")
+    return f"{name}-{digest.hexdigest()[:10]}"
+
+
+def cut_pyramid(path: str, name: str) -> dict:
+    """Write every level's tiles for one source; returns its manifest entry."""
+    with Image.open(path) as original:
+        original.load()
+    width, height = original.size
+    top = max_zoom(width, height)
+    out = TILES_DIR / name
+    for zoom in range(top + 1):
+        level_w, level_h = level_size(width, height, zoom, top)
+        level = original if zoom == top else original.resize((level_w, level_h), Image.LANCZOS)
+        (out / str(zoom)).mkdir(parents=True, exist_ok=True)
+        for x in range(0, level_w, TILE_SIZE):
+            for y in range(0, level_h, TILE_SIZE):
+                tile = level.crop((x, y, min(x + TILE_SIZE, level_w), min(y + TILE_SIZE, level_h)))
+                tile.save(out / str(zoom) / f"{x // TILE_SIZE}_{y // TILE_SIZE}.webp", format="WEBP", **WEBP_OPTIONS)
+    return {
+        "width": width,
+        "height": height,
+        "tile_size": TILE_SIZE,
+        "max_zoom": top,
+        "url": f"{TILES_URL}/{name}/{{z}}/{{x}}_{{y}}.webp",
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--force", action="store_true", help="re-cut even if unchanged")
+    args = parser.parse_args()
+
+    TILES_DIR.mkdir(parents=True, exist_ok=True)
+    manifest = {} if args.force or not MANIFEST_PATH.exists() else json.loads(MANIFEST_PATH.read_text())
+
+    sources = sorted(SOURCE_DIR.glob("*.png"))
+    names = {source_url(p): pyramid_dir(p) for p in sources}
+    stale = [
+        p for p in sources
+        if f"/{names[source_url(p)]}/" not in manifest.get(source_url(p), {}).get("url", "")
+        or not (TILES_DIR / names[source_url(p)]).is_dir()
+    ]
+    for path in stale:
+        shutil.rmtree(TILES_DIR / names[source_url(path)], ignore_errors=True)
+
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        entries = pool.map(cut_pyramid, [str(p) for p in stale], [names[source_url(p)] for p in stale])
+        for path, entry in zip(stale, entries):
+            manifest[source_url(path)] = entry
+
+    manifest = {url: manifest[url] for url in sorted(names)}
+    keep = set(names.values())
+    for leftover in TILES_DIR.iterdir():
+        if leftover.is_dir() and leftover.name not in keep:
+            shutil.rmtree(leftover)
+
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2))
+    tiles = sum(1 for _ in TILES_DIR.rglob("*.webp"))
+    print(f"Cut {len(stale)}/{len(sources)} maps into {tiles} tiles in {TILES_DIR}/")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Download a poster thumbnail for every catalog location's Sketchfab model.
+
+Usage:
+    python build_sketchfab_posters.py [--jobs N] [--force]
+
+Each model's thumbnails are listed by the Sketchfab Data API; the smallest
+one at least ``POSTER_WIDTH`` wide (or the largest available) is resized to
+``POSTER_WIDTH`` and saved as ``assets/sketchfab/<model_id>.webp``. Models
+that already have a poster are skipped, and posters of models no longer in
+the catalog are removed.
+"""
+import argparse
+import io
+import json
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+
+from app.services.catalog import CATALOG
+from app.services.sketchfab_posters import POSTER_WIDTH, POSTERS_DIR, poster_path
+
+API_URL = "https://api.sketchfab.com/v3/models/{model_id}"
+TIMEOUT = 30
+
+
+def _get(url: str) -> bytes:
+    request = urllib.request.Request(url, headers={"User-Agent": "poly-u-nap-posters"})
+    with urllib.request.urlopen(request, timeout=TIMEOUT) as response:
+        return response.read()
+
+
+def thumbnail_url(model_id: str) -> str:
+    images = json.loads(_get(API_URL.format(model_id=model_id)))["thumbnails"]["images"]
+    wide_enough = [image for image in images if image["width"] >= POSTER_WIDTH]
+    if wide_enough:
+        return min(wide_enough, key=lambda image: image["width"])["url"]
+    return max(images, key=lambda image: image["width"])["url"]
+
+
+def build_poster(model_id: str) -> None:
+    with Image.open(io.BytesIO(_get(thumbnail_url(model_id)))) as image:
+        poster = image.convert("RGB")
+    if poster.width > POSTER_WIDTH:
+        poster = poster.resize((POSTER_WIDTH, round(poster.height * POSTER_WIDTH / poster.width)), Image.LANCZOS)
+    poster.save(poster_path(model_id), format="WEBP", quality=80, method=6)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=4, help="parallel downloads")
+    parser.add_argument("--force", action="store_true", help="re-download existing posters")
+    args = parser.parse_args()
+
+    POSTERS_DIR.mkdir(parents=True, exist_ok=True)
+    model_ids = sorted({location.model_id for location in CATALOG if location.model_id})
+    missing = [m for m in model_ids if args.force or not poster_path(m).exists()]
+
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        results = dict(zip(missing, pool.map(_try_build, missing)))
+
+    for leftover in POSTERS_DIR.glob("*.webp"):
+        if leftover.stem not in model_ids:
+            leftover.unlink()
+
+    failed = {m: error for m, error in results.items() if error}
+    for model_id, error in failed.items():
+        print(f"{model_id}: {error}")
+    print(f"Built {len(missing) - len(failed)}/{len(missing)} posters in {POSTERS_DIR}/ ({len(model_ids)} models)")
+    if failed:
+        raise SystemExit(1)
+
+
+def _try_build(model_id: str) -> str | None:
+    try:
+        build_poster(model_id)
+    except (OSError, KeyError, ValueError) as error:
+        return str(error)
+    return None
+
+
+if __name__ == "__main__":
+    main()
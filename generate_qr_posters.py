@@ -0,0 +1,157 @@
+"""Render print-ready QR stickers for every location in the catalog.
+
+Usage:
+    python generate_qr_posters.py [--out qr_posters] [--jobs N] [--force]
+
+Each location gets a sticker (QR code, name and rarity label) rendered in a
+process pool. Stickers are only re-rendered when their content hash changes,
+and stickers are then laid out on A4 sheets written as PNGs plus one PDF.
+"""
+import argparse
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import Image, ImageDraw, ImageFont
+
+from app.services.catalog import CATALOG
+from app.services.checkin_tokens import current_bucket
+from app.services.qr import BACK_COLOR, QR_STYLE_VERSION, location_qr_data, render_qr
+
+STICKER_SIZE = (760, 900)
+SHEET_SIZE = (2480, 3508)  # A4 at 300 dpi
+SHEET_GRID = (3, 3)
+SHEET_DPI = 300
+
+RARITY_COLORS = {
+    "LEGENDARY": "#ffd700",
+    "EPIC": "#bd00ff",
+    "RARE": "#00d4ff",
+    "UNCOMMON": "#00ff9f",
+    "MYTHICAL": "#ff0055",
+}
+
+
+def _font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    for name in ("DejaVuSans-Bold.ttf", "Arial Bold.ttf", "arialbd.ttf"):
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    return ImageFont.load_default(size=size)
+
+
+def sticker_job(location, bucket: int) -> dict:
+    """Everything that determines a sticker's pixels, used for hashing."""
+    return {
+        "id": location.id,
+        "name": location.name,
+        "rarity": location.rarity,
+        "data": location_qr_data(location.id, bucket),
+        "style": QR_STYLE_VERSION,
+        "size": STICKER_SIZE,
+    }
+
+
+def content_hash(job: dict) -> str:
+    return hashlib.sha256(json.dumps(job, sort_keys=True).encode()).hexdigest()
+
+
+def render_sticker(job: dict, path: str) -> None:
+    width, height = job["size"]
+    color = RARITY_COLORS.get(job["rarity"], "#808080")
+    sticker = Image.new("RGB", (width, height), BACK_COLOR)
+    draw = ImageDraw.Draw(sticker)
+    draw.rectangle((0, 0, width - 1, height - 1), outline=color, width=12)
+
+    qr = render_qr(job["data"], box_size=20, border=2).convert("RGB")
+    side = width - 120
+    qr = qr.resize((side, side), Image.NEAREST)
+    sticker.paste(qr, ((width - side) // 2, 50))
+
+    name_font = _font(40)
+    label_font = _font(30)
+    text_top = 50 + side + 25
+    draw.text((width // 2, text_top), job["name"], fill="#ffffff", font=name_font, anchor="mt")
+    draw.text((width // 2, text_top + 60), f"[ {job['rarity']} ]", fill=color, font=label_font, anchor="mt")
+    sticker.save(path, format="PNG", dpi=(SHEET_DPI, SHEET_DPI))
+
+
+def render_sheet(sticker_paths: list[str], path: str) -> None:
+    sheet = Image.new("RGB", SHEET_SIZE, "#ffffff")
+    cols, rows = SHEET_GRID
+    cell_w, cell_h = SHEET_SIZE[0] // cols, SHEET_SIZE[1] // rows
+    for i, sticker_path in enumerate(sticker_paths):
+        with Image.open(sticker_path) as sticker:
+            x = (i % cols) * cell_w + (cell_w - sticker.width) // 2
+            y = (i // cols) * cell_h + (cell_h - sticker.height) // 2
+            sheet.paste(sticker, (x, y))
+    sheet.save(path, format="PNG", dpi=(SHEET_DPI, SHEET_DPI))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", default="qr_posters", help="output directory")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--force", action="store_true", help="re-render even if unchanged")
+    parser.add_argument(
+        "--bucket", type=int, default=None,
+        help="check-in token bucket to sign for (default: current)",
+    )
+    args = parser.parse_args()
+    if not os.environ.get("POLYUNAP_CHECKIN_SECRET"):
+        parser.error("POLYUNAP_CHECKIN_SECRET must be set to the server's secret so printed codes verify")
+
+    out = Path(args.out)
+    stickers_dir = out / "stickers"
+    sheets_dir = out / "sheets"
+    stickers_dir.mkdir(parents=True, exist_ok=True)
+    sheets_dir.mkdir(parents=True, exist_ok=True)
+
+    manifest_path = out / "manifest.json"
+    manifest = {} if args.force or not manifest_path.exists() else json.loads(manifest_path.read_text())
+    old_stickers = manifest.get("stickers", {})
+    old_sheets = manifest.get("sheets", {})
+
+    bucket = current_bucket() if args.bucket is None else args.bucket
+    jobs = [sticker_job(location, bucket) for location in CATALOG]
+    hashes = {job["id"]: content_hash(job) for job in jobs}
+    paths = {job["id"]: str(stickers_dir / f"{job['id']}.png") for job in jobs}
+    stale = [
+        job for job in jobs
+        if old_stickers.get(job["id"]) != hashes[job["id"]] or not Path(paths[job["id"]]).exists()
+    ]
+
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        list(pool.map(render_sticker, stale, [paths[job["id"]] for job in stale]))
+
+        per_sheet = SHEET_GRID[0] * SHEET_GRID[1]
+        ids = [job["id"] for job in jobs]
+        sheets = {}
+        sheet_args = []
+        for n, start in enumerate(range(0, len(ids), per_sheet), start=1):
+            chunk = ids[start:start + per_sheet]
+            name = f"sheet-{n:02d}.png"
+            sheets[name] = hashlib.sha256("".join(hashes[i] for i in chunk).encode()).hexdigest()
+            if old_sheets.get(name) != sheets[name] or not (sheets_dir / name).exists():
+                sheet_args.append(([paths[i] for i in chunk], str(sheets_dir / name)))
+        if sheet_args:
+            list(pool.map(render_sheet, *zip(*sheet_args)))
+
+    for leftover in sheets_dir.glob("sheet-*.png"):
+        if leftover.name not in sheets:
+            leftover.unlink()
+
+    pdf_path = out / "stickers.pdf"
+    if sheet_args or not pdf_path.exists():
+        pages = [Image.open(sheets_dir / name).convert("RGB") for name in sorted(sheets)]
+        pages[0].save(pdf_path, format="PDF", save_all=True, append_images=pages[1:], resolution=SHEET_DPI)
+
+    manifest_path.write_text(json.dumps({"stickers": hashes, "sheets": sheets}, indent=2, sort_keys=True))
+    print(f"Rendered {len(stale)}/{len(jobs)} stickers and {len(sheet_args)}/{len(sheets)} sheets into {out}/")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,17 @@
+import os
+
 import reflex as rx
 
-config = rx.Config(app_name="app", plugins=[rx.plugins.TailwindV3Plugin(), rx.plugins.sitemap.SitemapPlugin()])
+# Idle sessions expire after this many seconds. The default disk state manager
+# drops them from memory and deletes their saved state; with REDIS_URL set the
+# same value is the Redis key TTL. A returning tab is asked to reload and
+# restores its progress from its saved profile (UserState.load_profile).
+# POLYUNAP_REDIS_MAXMEMORY additionally caps Redis, evicting the least recently
+# used sessions first (see app/sessions.py).
+SESSION_TTL = int(os.environ.get("POLYUNAP_SESSION_TTL", "1800"))
+
+config = rx.Config(
+    app_name="app",
+    plugins=[rx.plugins.TailwindV3Plugin(), rx.plugins.sitemap.SitemapPlugin()],
+    redis_token_expiration=SESSION_TTL,
+)
@@ -0,0 +1,22 @@
+import os
+
+os.environ.setdefault("POLYUNAP_CHECKIN_SECRET", "test-secret")
+
+import pytest
+
+from app.services.checkin_tokens import issue_token, verify_token
+
+LOCATION_ID = "the-modular-dream"
+
+
+def test_issued_token_verifies():
+    assert verify_token(LOCATION_ID, issue_token(LOCATION_ID))
+
+
+def test_token_for_another_location_is_rejected():
+    assert not verify_token("cloud-nine-credit", issue_token(LOCATION_ID))
+
+
+@pytest.mark.parametrize("token", ["", ".", "abc", "12", "x.abc", "².abc", "١٢.abc", "12.é"])
+def test_malformed_token_is_rejected(token):
+    assert not verify_token(LOCATION_ID, token)